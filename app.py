@@ -3,16 +3,14 @@
 
 """
 联盟项目UDS终端 - 拆分式启动器
-先完全展示启动画面，然后再启动主窗口
+启动画面播放期间构建主窗口，两者都就绪后切换
 """
 
 import sys
 import os
-import time
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QTimer, QEventLoop
+from PyQt6.QtCore import Qt, QTimer
 from ui.splash_screen import StartupSplashScreen
-from ui.main_window import MainWindow
 
 def main():
     """启动器主函数"""
@@ -29,9 +27,6 @@ def main():
         app = QApplication(sys.argv)
         app.setStyle("Fusion")  # 使用fusion风格,跨平台一致性更好
         
-        # 创建一个全局窗口引用，防止垃圾回收
-        global main_window
-        
         # 完全简化启动流程
         print("启动应用程序组件...")
         
@@ -44,24 +39,57 @@ def main():
         y = int((screen_geometry.height() - splash.height()) / 2)
         splash.move(x, y)
         
-        # 设置右键跳过变量
-        skip_intro = False
+        # 启动状态: 主窗口是否已构建完成, 启动消息是否已播放完毕
+        window_ready = False
+        intro_done = False
+        
+        def finish_startup():
+            """主窗口与启动动画都就绪后切换到主窗口"""
+            if not (window_ready and intro_done):
+                return
+            if not splash.isVisible():
+                return
+            
+            # 确保窗口在屏幕中央
+            screen_geometry = app.primaryScreen().geometry()
+            window_geometry = main_window.geometry()
+            x = int((screen_geometry.width() - window_geometry.width()) / 2)
+            y = int((screen_geometry.height() - window_geometry.height()) / 2)
+            main_window.move(x, y)
+            
+            # 显示窗口，使用标准Qt方法
+            main_window.show()
+            print("主窗口已创建并显示")
+            
+            # 关闭启动画面
+            splash.close()
+            print("启动画面已关闭")
+            
+            # 强制窗口活跃并置于前台
+            main_window.activateWindow()
+            main_window.raise_()
+            main_window.setWindowState(main_window.windowState() | Qt.WindowState.WindowActive)
+            print("窗口已激活")
+        
+        # 启动动画结束（播放完毕或被跳过）时的处理函数
+        def on_intro_finished():
+            nonlocal intro_done
+            if intro_done:
+                return
+            intro_done = True
+            finish_startup()
         
         # 定义右键跳过处理函数
         def on_skip_requested():
-            nonlocal skip_intro
-            skip_intro = True
             print("用户请求跳过启动画面")
-            # 确保事件循环退出
-            if 'loop' in locals():
-                loop.quit()
+            splash.intro_finished.emit()
         
-        # 连接右键跳过信号
+        # 连接启动动画结束和右键跳过信号
+        splash.intro_finished.connect(on_intro_finished)
         splash.skip_requested.connect(on_skip_requested)
         
-        # 显示启动画面
+        # 显示启动画面，首次绘制由事件循环完成
         splash.show()
-        app.processEvents()  # 强制处理事件,确保立即显示
         print("启动画面已显示")
         
         # 显示启动消息 - 更详细的系统检查步骤
@@ -83,73 +111,41 @@ def main():
             "正在启动主界面..."
         ]
         
-        # 使用打字机效果显示消息
-        def show_next_message(index):
-            if index >= len(messages):
-                return
-                
-            msg = messages[index]
-            print(f"显示消息: {msg}")
-            
-            # 使用打字机效果显示消息
-            def on_message_complete():
-                # 消息显示完成后，延迟显示下一条
-                delay = 500  # 增加基础延迟，确保消息有足够时间显示
-                
-                # 为不同消息设置不同的延迟
-                if index == 0 or index == len(messages) - 1:
-                    delay = 800  # 第一条和最后一条消息显示更长时间
-                elif "授权" in msg or "安全" in msg:
-                    delay = 700  # 安全相关消息显示稍长
-                
-                # 确保前一条消息完全显示后再显示下一条
-                QTimer.singleShot(delay, lambda: show_next_message(index + 1))
-            
-            # 显示消息并设置完成回调
-            splash.showMessageWithCallback(msg, on_message_complete)
-            app.processEvents()  # 确保消息立即开始显示
-        
-        # 只有在不跳过介绍时才显示消息
-        if not skip_intro:
-            # 开始显示第一条消息
-            show_next_message(0)
+        # 计算每条消息显示完成后的停顿时间
+        def message_pause(index, msg):
+            delay = 500  # 基础延迟，确保消息有足够时间显示
             
-            # 创建事件循环等待所有消息显示完成
-            loop = QEventLoop()
-            QTimer.singleShot(len(messages) * 800, loop.quit)  # 估计总时间
-            loop.exec()
-            
-            # 等待足够长的时间，让用户欣赏启动动画（如果没有被跳过）
-            if not skip_intro:
-                time.sleep(1.5)
-        
-        print("创建主窗口...")
-        # 创建主窗口
-        main_window = MainWindow()
-        
-        # 确保窗口在屏幕中央
-        screen_geometry = app.primaryScreen().geometry()
-        window_geometry = main_window.geometry()
-        x = int((screen_geometry.width() - window_geometry.width()) / 2)
-        y = int((screen_geometry.height() - window_geometry.height()) / 2)
-        main_window.move(x, y)
-        
-        # 显示窗口，使用标准Qt方法
-        main_window.show()
-        print("主窗口已创建并显示")
-        
-        # 关闭启动画面
-        splash.close()
-        print("启动画面已关闭")
-        
-        # 强制处理事件
-        app.processEvents()
-        
-        # 强制窗口活跃并置于前台
-        main_window.activateWindow()
-        main_window.raise_()
-        main_window.setWindowState(main_window.windowState() | Qt.WindowState.WindowActive)
-        print("窗口已激活")
+            # 为不同消息设置不同的延迟
+            if index == 0 or index == len(messages) - 1:
+                delay = 800  # 第一条和最后一条消息显示更长时间
+            elif "授权" in msg or "安全" in msg:
+                delay = 700  # 安全相关消息显示稍长
+            return delay
+        
+        # 预先计算整个播放时间表，由启动画面的动画定时器统一驱动
+        schedule = [(msg, message_pause(i, msg)) for i, msg in enumerate(messages)]
+        
+        def on_message_completed(index):
+            # 第一条消息显示完成时启动画面已完成绘制，开始构建主窗口
+            if index == 0:
+                QTimer.singleShot(0, build_main_window)
+        
+        splash.message_completed.connect(on_message_completed)
+        
+        # 在启动动画播放期间构建主窗口，而不是等动画结束后再构建
+        def build_main_window():
+            global main_window
+            nonlocal window_ready
+            print("创建主窗口...")
+            # 延迟导入主窗口模块，使启动画面无需等待整个UI与核心模块加载
+            from ui.main_window import MainWindow
+            main_window = MainWindow()
+            window_ready = True
+            finish_startup()
+        
+        # 开始按时间表播放启动消息
+        print("播放启动消息...")
+        splash.play_messages(schedule)
         
         # 进入应用事件循环
         print("进入应用事件循环...")
@@ -8,9 +8,93 @@
 
 import os
 import json
-import requests
 import re
-from PyQt6.QtCore import QObject, pyqtSignal, QSettings
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, QSettings
+
+# 可选使用orjson加速请求体序列化和响应解析，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 可选使用pyahocorasick在一次线性扫描中定位所有误译占位符，未安装时使用正则
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _dumps(data):
+    """将请求体序列化为UTF-8编码的JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(content):
+    """解析JSON响应内容"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# 匹配[xxx]格式的占位符
+_PLACEHOLDER_RE = re.compile(r'\[([^\]]+)\]')
+
+# 模型误译的占位符及其原始形式
+_CORRECTIONS = {
+    '[姓名]': '[name]',
+    '[名字]': '[name]',
+    '[人名]': '[name]',
+    '[用户]': '[name]',
+    '[玩家]': '[name]',
+    '[角色]': '[character]',
+    '[数值]': '[value]',
+    '[数字]': '[number]',
+    '[地点]': '[location]',
+    '[物品]': '[item]',
+    '[武器]': '[weapon]'
+}
+
+# 一次扫描匹配所有误译占位符
+_CORRECTIONS_RE = re.compile('|'.join(re.escape(wrong) for wrong in _CORRECTIONS))
+
+if ahocorasick is not None:
+    _CORRECTIONS_AUTOMATON = ahocorasick.Automaton()
+    for _wrong, _right in _CORRECTIONS.items():
+        _CORRECTIONS_AUTOMATON.add_word(_wrong, (len(_wrong), _right))
+    _CORRECTIONS_AUTOMATON.make_automaton()
+else:
+    _CORRECTIONS_AUTOMATON = None
+
+
+def _apply_corrections(text):
+    """将译文中模型误译的占位符还原为原始形式"""
+    if _CORRECTIONS_AUTOMATON is None:
+        return _CORRECTIONS_RE.sub(lambda match: _CORRECTIONS[match.group(0)], text)
+    
+    # 误译占位符都以方括号包围且内部不含方括号，命中之间不会重叠
+    parts = []
+    pos = 0
+    for end, (length, right) in _CORRECTIONS_AUTOMATON.iter(text):
+        start = end - length + 1
+        parts.append(text[pos:start])
+        parts.append(right)
+        pos = end + 1
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+# 批量翻译时附加在编号文本前的说明
+_BATCH_PROMPT = "以下是若干编号的文本行，请逐行翻译，并按相同编号逐行输出译文：\n"
+
+# 匹配译文中"1. "、"2．"、"3、"形式的行首编号
+_NUMBERED_LINE_RE = re.compile(r'^\s*(\d+)\s*[.．、]\s*', re.MULTILINE)
 
 class TranslationAPI(QObject):
     """翻译API基类，提供统一接口"""
@@ -19,11 +103,214 @@ class TranslationAPI(QObject):
     translation_completed = pyqtSignal(str, str)  # 原文, 译文
     error_occurred = pyqtSignal(str)  # 错误信息
     
+    # 所有翻译器共享的HTTP会话(首次请求时创建)，复用TCP/TLS连接
+    _session = None
+    _session_is_http2 = False
+    _session_lock = threading.Lock()
+    
+    # 同时进行的API请求上限，避免并行翻译触发限流
+    MAX_CONCURRENT_REQUESTS = 4
+    _request_semaphore = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    # 限流和服务端错误的重试次数、退避系数和需要重试的状态码，requests和httpx会话共用
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+    
+    # 后台翻译线程池，flush_pending提交的批次在其中执行
+    _executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+    
+    # 进程内译文缓存(LRU)，键为(翻译器类名, 模型, 原文)
+    CACHE_SIZE = 4096
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    
+    # translate_async的批处理窗口(毫秒)和单批最大条目数
+    BATCH_WINDOW_MS = 250
+    BATCH_MAX_SIZE = 8
+    
+    # 子类声明的设置键前缀、默认模型和默认API地址
+    SETTINGS_PREFIX = None
+    DEFAULT_MODEL = ""
+    DEFAULT_URL = ""
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = QSettings("HDCTranslator", "Translation")
-        # 用于占位符处理的正则表达式
-        self.placeholder_pattern = r'\[([^\]]+)\]'
+        # 尚未写入QSettings的设置，在save_settings时统一写入
+        self._pending_settings = {}
+        # 请求头缓存，在API密钥变化时重建
+        self.headers = {}
+        # 请求体模板缓存，在模型变化时重建
+        self._request_template = None
+        
+        # 非界面调用方的同步完成回调，设置后不再发出translation_completed信号
+        self._sync_callback = None
+        
+        # translate_async的待翻译队列，由单次定时器触发合并翻译
+        self._pending_texts = []
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.timeout.connect(self.flush_pending)
+        
+        if self.SETTINGS_PREFIX:
+            self.api_key = self.settings.value(f"{self.SETTINGS_PREFIX}/api_key", "")
+            self.model = self.settings.value(f"{self.SETTINGS_PREFIX}/model", self.DEFAULT_MODEL)
+            self.base_url = self.settings.value(f"{self.SETTINGS_PREFIX}/base_url", self.DEFAULT_URL)
+            self.headers = self.build_headers()
+    
+    @classmethod
+    def get_session(cls):
+        """
+        获取共享的HTTP会话，启用连接池和失败重试
+        
+        安装了httpx和h2时使用支持HTTP/2多路复用的httpx客户端，
+        并行翻译的多个请求可共用同一条TLS连接；否则使用requests会话
+        
+        Returns:
+            httpx.Client | requests.Session: 共享会话
+        """
+        if TranslationAPI._session is None:
+            with TranslationAPI._session_lock:
+                if TranslationAPI._session is None:
+                    client = cls._create_http2_client()
+                    TranslationAPI._session_is_http2 = client is not None
+                    TranslationAPI._session = client or cls._create_requests_session()
+        return TranslationAPI._session
+    
+    @classmethod
+    def _create_http2_client(cls):
+        """
+        创建支持HTTP/2的httpx客户端
+        
+        Returns:
+            httpx.Client: 客户端，httpx或h2未安装时返回None
+        """
+        try:
+            import httpx
+            import h2  # noqa: F401  httpx的HTTP/2支持依赖h2
+        except ImportError:
+            return None
+        
+        # httpx的重试只覆盖连接失败，限流和服务端错误由_send_http2按状态码重试
+        transport = httpx.HTTPTransport(http2=True, retries=3)
+        limits = httpx.Limits(max_connections=16, max_keepalive_connections=4)
+        return httpx.Client(transport=transport, limits=limits)
+    
+    @classmethod
+    def _create_requests_session(cls):
+        """
+        创建带连接池和失败重试的requests会话
+        
+        Returns:
+            requests.Session: 会话
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # 对限流和服务端错误自动重试，重试耗尽后交由raise_for_status处理
+        retry = Retry(
+            total=cls.RETRY_TOTAL,
+            backoff_factor=cls.RETRY_BACKOFF,
+            status_forcelist=list(cls.RETRY_STATUS),
+            allowed_methods=frozenset(["POST"]),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def _post_json(self, data, timeout):
+        """
+        通过共享会话向API发送请求并解析JSON响应，并发数受信号量限制
+        
+        以流式方式接收响应：状态码表示错误时在下载响应体之前即抛出异常，
+        成功时分块读取响应体后一次解析
+        
+        Args:
+            data: 请求体
+            timeout: 超时时间(秒)
+            
+        Returns:
+            dict: 解析后的响应
+        """
+        session = self.get_session()
+        body = _dumps(data)
+        with TranslationAPI._request_semaphore:
+            if TranslationAPI._session_is_http2:
+                response = self._send_http2(session, body, timeout)
+                try:
+                    response.raise_for_status()
+                    content = b"".join(response.iter_bytes())
+                finally:
+                    response.close()
+            else:
+                with session.post(self.base_url, headers=self.headers, data=body,
+                                  timeout=timeout, stream=True) as response:
+                    response.raise_for_status()
+                    content = b"".join(response.iter_content(chunk_size=8192))
+        return _loads(content)
+    
+    def _send_http2(self, session, body, timeout):
+        """
+        通过httpx客户端发送请求，对限流和服务端错误按状态码退避重试
+        
+        与requests会话的urllib3 Retry保持一致：最多重试RETRY_TOTAL次，
+        优先遵循响应的Retry-After头，否则按RETRY_BACKOFF指数退避
+        
+        Args:
+            session: httpx客户端
+            body: 请求体字节串
+            timeout: 超时时间(秒)
+            
+        Returns:
+            httpx.Response: 以流式方式接收的响应，重试耗尽后返回最后一次响应
+        """
+        for attempt in range(self.RETRY_TOTAL + 1):
+            request = session.build_request(
+                "POST", self.base_url, headers=self.headers, content=body, timeout=timeout
+            )
+            response = session.send(request, stream=True)
+            if response.status_code not in self.RETRY_STATUS or attempt == self.RETRY_TOTAL:
+                return response
+            
+            retry_after = response.headers.get("Retry-After", "")
+            response.close()
+            delay = float(retry_after) if retry_after.isdigit() else self.RETRY_BACKOFF * (2 ** attempt)
+            time.sleep(delay)
+    
+    def build_headers(self):
+        """
+        构建请求头(由子类实现)
+        
+        Returns:
+            dict: 请求头
+        """
+        raise NotImplementedError("需要由子类实现")
+    
+    def build_request_template(self):
+        """
+        构建不含待译文本的请求体模板(由子类实现)
+        
+        Returns:
+            dict: 请求体模板
+        """
+        raise NotImplementedError("需要由子类实现")
+    
+    def get_request_template(self):
+        """
+        获取缓存的请求体模板，模板只读，组装请求时需浅拷贝
+        
+        Returns:
+            dict: 请求体模板
+        """
+        if self._request_template is None:
+            self._request_template = self.build_request_template()
+        return self._request_template
     
     def translate(self, text):
         """
@@ -47,26 +334,81 @@ class TranslationAPI(QObject):
         Returns:
             str: 处理后的翻译文本
         """
-        # 直接提取所有[xxx]格式的占位符
-        placeholders = re.findall(self.placeholder_pattern, text)
+        result = self.translate_many([text])[0]
+        
+        # 通知翻译完成
+        self._notify_completed(text, result)
         
-        if not placeholders:
-            # 没有占位符，直接翻译整个文本
-            result = self._do_translate(text)
-            # 发送翻译完成信号
+        return result
+    
+    def set_sync_callback(self, callback):
+        """
+        设置同步完成回调，供批量脚本等非界面调用方使用
+        
+        设置后翻译完成时直接调用callback(原文, 译文)，跳过Qt信号分发；传入None恢复发出信号
+        
+        Args:
+            callback: 回调函数，或None
+        """
+        self._sync_callback = callback
+    
+    def _notify_completed(self, text, result):
+        """通知翻译完成：设置了同步回调时直接调用，否则发出translation_completed信号"""
+        if self._sync_callback is not None:
+            self._sync_callback(text, result)
+        else:
             self.translation_completed.emit(text, result)
-            return result
+    
+    def translate_many(self, texts):
+        """
+        翻译多条文本并保护占位符，所有文本片段合并为一次请求
+        
+        Args:
+            texts: 要翻译的文本列表
+            
+        Returns:
+            list: 与texts一一对应的译文列表
+        """
+        all_segments = [self.split_segments(text) for text in texts]
+        
+        # 只翻译文本部分，所有文本片段合并为一次请求
+        pieces = [
+            segment["content"]
+            for segments in all_segments
+            for segment in segments
+            if segment["type"] == "text"
+        ]
+        translations = iter(self._do_translate_batch(pieces))
+        
+        return [self.join_segments(segments, translations) for segments in all_segments]
+    
+    @staticmethod
+    def split_segments(text):
+        """
+        将原文分割成文本片段和占位符
+        
+        Args:
+            text: 原文
+            
+        Returns:
+            list: 片段列表，每项为{"type": "text"|"placeholder", "content": str}
+        """
+        # 一次扫描找出所有[xxx]格式的占位符
+        matches = list(_PLACEHOLDER_RE.finditer(text))
         
-        print(f"发现 {len(placeholders)} 个占位符，将分离处理")
+        if not matches:
+            # 没有占位符，整个文本作为一个片段
+            return [{"type": "text", "content": text}]
+        
+        print(f"发现 {len(matches)} 个占位符，将分离处理")
         
-        # 将原文分割成文本片段和占位符
         segments = []
         last_end = 0
         
         # 按顺序查找占位符的位置
-        for match in re.finditer(self.placeholder_pattern, text):
+        for match in matches:
             start, end = match.span()
-            placeholder = match.group(0)  # 完整的[xxx]
+            placeholder = text[start:end]  # 完整的[xxx]，直接切片比group(0)更快
             
             # 添加占位符前的文本（如果有）
             if start > last_end:
@@ -85,39 +427,188 @@ class TranslationAPI(QObject):
             if text_after.strip():
                 segments.append({"type": "text", "content": text_after})
         
-        # 只翻译文本部分，保留占位符
-        result = ""
+        return segments
+    
+    @staticmethod
+    def join_segments(segments, translations):
+        """
+        按原顺序拼接译文，原样保留占位符，并修正误译的占位符
+        
+        Args:
+            segments: split_segments返回的片段列表
+            translations: 文本片段译文的迭代器，按顺序逐个取用
+            
+        Returns:
+            str: 拼接后的译文
+        """
+        parts = []
         for segment in segments:
             if segment["type"] == "text":
-                # 翻译文本
-                translated = self._do_translate(segment["content"])
-                result += translated
+                parts.append(next(translations))
             else:
-                # 原样保留占位符
-                result += segment["content"]
+                parts.append(segment["content"])
+        result = "".join(parts)
         
         # 检查常见错误并修正
-        corrections = {
-            '[姓名]': '[name]', 
-            '[名字]': '[name]',
-            '[人名]': '[name]',
-            '[用户]': '[name]',
-            '[玩家]': '[name]',
-            '[角色]': '[character]',
-            '[数值]': '[value]',
-            '[数字]': '[number]',
-            '[地点]': '[location]',
-            '[物品]': '[item]',
-            '[武器]': '[weapon]'
-        }
+        return _apply_corrections(result)
+    
+    def translate_async(self, text):
+        """
+        将文本加入待翻译队列，在批处理窗口结束或队列满时合并为批量请求翻译
         
-        for wrong, correct in corrections.items():
-            result = result.replace(wrong, correct)
+        每条文本翻译完成后分别发出translation_completed信号。需在GUI线程中调用，
+        本方法只负责入队，请求由定时器触发后在后台线程中发送。
         
-        # 发送翻译完成信号
-        self.translation_completed.emit(text, result)
+        Args:
+            text: 要翻译的文本
+        """
+        self._pending_texts.append(text)
         
-        return result
+        if len(self._pending_texts) >= self.BATCH_MAX_SIZE:
+            # 队列已满时不再等待窗口结束，在下一轮事件循环中发送，
+            # 调用方在同一轮循环中连续入队的文本仍会一并提交
+            self._batch_timer.start(0)
+        elif not self._batch_timer.isActive():
+            self._batch_timer.start(self.BATCH_WINDOW_MS)
+    
+    def flush_pending(self):
+        """将队列中的所有文本按BATCH_MAX_SIZE分批提交到后台线程翻译"""
+        self._batch_timer.stop()
+        pending, self._pending_texts = self._pending_texts, []
+        
+        for start in range(0, len(pending), self.BATCH_MAX_SIZE):
+            batch = pending[start:start + self.BATCH_MAX_SIZE]
+            self._executor.submit(self._translate_batch_in_background, batch)
+    
+    def _translate_batch_in_background(self, texts):
+        """后台线程中翻译一批文本，逐条通知完成，捕获异常并通过信号报告"""
+        try:
+            results = self.translate_many(texts)
+        except Exception as e:
+            self.error_occurred.emit(f"翻译失败: {str(e)}")
+            # 与_do_translate失败时一致返回空译文，确保每条文本都有完成通知
+            results = [""] * len(texts)
+        
+        # 跨线程的信号由Qt排队投递到接收者所在的线程
+        for text, result in zip(texts, results):
+            self._notify_completed(text, result)
+    
+    def _cache_key(self, text):
+        """生成译文缓存的键"""
+        return (self.__class__.__name__, self.model, text)
+    
+    def _cache_get(self, text):
+        """
+        从缓存中读取译文
+        
+        Args:
+            text: 原文
+            
+        Returns:
+            str: 缓存的译文，未命中时返回None
+        """
+        key = self._cache_key(text)
+        with TranslationAPI._cache_lock:
+            translation = TranslationAPI._cache.get(key)
+            if translation is not None:
+                TranslationAPI._cache.move_to_end(key)
+            return translation
+    
+    def _cache_put(self, text, translation):
+        """将译文写入缓存，空译文(请求失败)不缓存"""
+        if not translation:
+            return
+        key = self._cache_key(text)
+        with TranslationAPI._cache_lock:
+            TranslationAPI._cache[key] = translation
+            TranslationAPI._cache.move_to_end(key)
+            if len(TranslationAPI._cache) > self.CACHE_SIZE:
+                TranslationAPI._cache.popitem(last=False)
+    
+    def _do_translate_batch(self, texts):
+        """
+        在一次请求中翻译多个文本片段，已缓存的片段不再请求
+        
+        Args:
+            texts: 要翻译的文本片段列表
+            
+        Returns:
+            list: 与texts一一对应的译文列表
+        """
+        translations = [self._cache_get(text) for text in texts]
+        missing = [i for i, translation in enumerate(translations) if translation is None]
+        
+        if missing:
+            results = self._request_batch([texts[i] for i in missing])
+            for i, translation in zip(missing, results):
+                translations[i] = translation
+                self._cache_put(texts[i], translation)
+        
+        return translations
+    
+    def _request_batch(self, texts):
+        """
+        将多个文本片段合并为一次请求进行翻译
+        
+        将片段编号后合并发送，再按编号拆分译文；译文无法按编号拆分时退回逐段翻译
+        
+        Args:
+            texts: 要翻译的文本片段列表
+            
+        Returns:
+            list: 与texts一一对应的译文列表
+        """
+        if len(texts) <= 1:
+            return [self._do_translate(text) for text in texts]
+        
+        numbered_text = "\n".join(f"{i}. {text.strip()}" for i, text in enumerate(texts, 1))
+        response = self._do_translate(_BATCH_PROMPT + numbered_text)
+        
+        if not response:
+            # 请求失败，错误信息已由_do_translate发出
+            return [""] * len(texts)
+        
+        translations = self.split_numbered_lines(response, len(texts))
+        if translations is None:
+            # 批量译文编号不匹配，改为逐段翻译
+            return self._do_translate_each(texts)
+        
+        return translations
+    
+    def _do_translate_each(self, texts):
+        """
+        并行地逐段翻译多个文本片段
+        
+        Args:
+            texts: 要翻译的文本片段列表
+            
+        Returns:
+            list: 与texts一一对应的译文列表
+        """
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(self._do_translate, texts))
+    
+    @staticmethod
+    def split_numbered_lines(text, count):
+        """
+        将带编号的译文拆分为列表
+        
+        Args:
+            text: 模型返回的编号译文
+            count: 期望的条目数
+            
+        Returns:
+            list: 按编号顺序排列的译文，编号不完整时返回None
+        """
+        # 拆分结果形如 [前缀, 编号1, 内容1, 编号2, 内容2, ...]，前缀被丢弃
+        parts = _NUMBERED_LINE_RE.split(text)
+        numbers = parts[1::2]
+        contents = parts[2::2]
+        
+        if [int(number) for number in numbers] != list(range(1, count + 1)):
+            return None
+        
+        return [content.strip() for content in contents]
     
     def _do_translate(self, text):
         """
@@ -140,8 +631,28 @@ class TranslationAPI(QObject):
         """
         raise NotImplementedError("需要由子类实现")
     
+    def set_api_key(self, api_key):
+        """设置API密钥"""
+        self.api_key = api_key
+        self.headers = self.build_headers()
+        self._pending_settings[f"{self.SETTINGS_PREFIX}/api_key"] = api_key
+    
+    def set_model(self, model):
+        """设置模型名称"""
+        self.model = model
+        self._request_template = None
+        self._pending_settings[f"{self.SETTINGS_PREFIX}/model"] = model
+    
+    def set_base_url(self, base_url):
+        """设置API基础URL"""
+        self.base_url = base_url
+        self._pending_settings[f"{self.SETTINGS_PREFIX}/base_url"] = base_url
+    
     def save_settings(self):
-        """保存API设置"""
+        """保存API设置，将所有待写入的设置一次性写入并同步"""
+        for key, value in self._pending_settings.items():
+            self.settings.setValue(key, value)
+        self._pending_settings.clear()
         self.settings.sync()
     
     @staticmethod
@@ -172,26 +683,26 @@ class TranslationAPI(QObject):
 class OpenAITranslator(TranslationAPI):
     """OpenAI API翻译器，支持最新GPT-4模型"""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.api_key = self.settings.value("openai/api_key", "")
-        self.model = self.settings.value("openai/model", "gpt-4o")  # 默认使用最新的GPT-4o模型
-        self.base_url = self.settings.value("openai/base_url", "https://api.openai.com/v1/chat/completions")
+    SETTINGS_PREFIX = "openai"
+    DEFAULT_MODEL = "gpt-4o"  # 默认使用最新的GPT-4o模型
+    DEFAULT_URL = "https://api.openai.com/v1/chat/completions"
     
-    def set_api_key(self, api_key):
-        """设置API密钥"""
-        self.api_key = api_key
-        self.settings.setValue("openai/api_key", api_key)
-    
-    def set_model(self, model):
-        """设置模型名称"""
-        self.model = model
-        self.settings.setValue("openai/model", model)
+    def build_headers(self):
+        """构建请求头"""
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
     
-    def set_base_url(self, base_url):
-        """设置API基础URL"""
-        self.base_url = base_url
-        self.settings.setValue("openai/base_url", base_url)
+    def build_request_template(self):
+        """构建不含待译文本的请求体模板"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "你是一名专业翻译，将以下英文文本翻译成优雅流畅的中文。保留原文的意思和语调。只返回翻译结果，不要添加解释或额外内容。"}
+            ],
+            "temperature": 0.3
+        }
     
     def translate(self, text):
         """使用OpenAI API翻译文本并保护占位符"""
@@ -205,24 +716,10 @@ class OpenAITranslator(TranslationAPI):
             return ""
         
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "你是一名专业翻译，将以下英文文本翻译成优雅流畅的中文。保留原文的意思和语调。只返回翻译结果，不要添加解释或额外内容。"},
-                    {"role": "user", "content": text}
-                ],
-                "temperature": 0.3
-            }
+            template = self.get_request_template()
+            data = dict(template, messages=template["messages"] + [{"role": "user", "content": text}])
             
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
+            result = self._post_json(data, timeout=30)
             if "choices" in result and len(result["choices"]) > 0:
                 return result["choices"][0]["message"]["content"].strip()
             else:
@@ -242,10 +739,6 @@ class OpenAITranslator(TranslationAPI):
         try:
             # 使用一个简单的文本进行测试
             test_text = "Hello, this is a test."
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
             
             data = {
                 "model": self.model,
@@ -256,8 +749,7 @@ class OpenAITranslator(TranslationAPI):
                 "max_tokens": 50
             }
             
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=10)
-            response.raise_for_status()
+            self._post_json(data, timeout=10)
             
             return True
                 
@@ -269,27 +761,31 @@ class OpenAITranslator(TranslationAPI):
 class ClaudeTranslator(TranslationAPI):
     """Anthropic Claude API翻译器，支持最新Claude 3模型"""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.api_key = self.settings.value("claude/api_key", "")
-        # 默认使用最新的Claude 3 Opus模型
-        self.model = self.settings.value("claude/model", "claude-3-opus-20240229")
-        self.base_url = self.settings.value("claude/base_url", "https://api.anthropic.com/v1/messages")
+    SETTINGS_PREFIX = "claude"
+    DEFAULT_MODEL = "claude-3-opus-20240229"  # 默认使用最新的Claude 3 Opus模型
+    DEFAULT_URL = "https://api.anthropic.com/v1/messages"
     
-    def set_api_key(self, api_key):
-        """设置API密钥"""
-        self.api_key = api_key
-        self.settings.setValue("claude/api_key", api_key)
+    # 翻译指令，作为固定的system前缀发送以便命中服务端提示缓存
+    SYSTEM_PROMPT = "你是一名专业翻译，将用户提供的英文文本翻译成优雅流畅的中文。保留原文的意思和语调。只返回翻译结果，不要添加解释或额外内容。"
     
-    def set_model(self, model):
-        """设置模型名称"""
-        self.model = model
-        self.settings.setValue("claude/model", model)
+    def build_headers(self):
+        """构建请求头"""
+        return {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01"
+        }
     
-    def set_base_url(self, base_url):
-        """设置API基础URL"""
-        self.base_url = base_url
-        self.settings.setValue("claude/base_url", base_url)
+    def build_request_template(self):
+        """构建不含待译文本的请求体模板"""
+        return {
+            "model": self.model,
+            "system": [
+                {"type": "text", "text": self.SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 4000
+        }
     
     def translate(self, text):
         """使用Claude API翻译文本并保护占位符"""
@@ -303,26 +799,12 @@ class ClaudeTranslator(TranslationAPI):
             return ""
         
         try:
-            # 使用最新的API版本
-            headers = {
-                "Content-Type": "application/json",
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01"
-            }
+            data = dict(
+                self.get_request_template(),
+                messages=[{"role": "user", "content": text}]
+            )
             
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "user", "content": f"将以下英文文本翻译成优雅流畅的中文。保留原文的意思和语调。只返回翻译结果，不要添加解释或额外内容。\n\n{text}"}
-                ],
-                "temperature": 0.3,
-                "max_tokens": 4000
-            }
-            
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
+            result = self._post_json(data, timeout=30)
             
             # 处理响应格式
             if "content" in result:
@@ -353,11 +835,6 @@ class ClaudeTranslator(TranslationAPI):
         try:
             # 使用一个简单的文本进行测试
             test_text = "Hello, this is a test."
-            headers = {
-                "Content-Type": "application/json",
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01"
-            }
             
             data = {
                 "model": self.model,
@@ -367,8 +844,7 @@ class ClaudeTranslator(TranslationAPI):
                 "max_tokens": 50
             }
             
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=10)
-            response.raise_for_status()
+            self._post_json(data, timeout=10)
             
             return True
                 
@@ -380,27 +856,28 @@ class ClaudeTranslator(TranslationAPI):
 class OpenRouterTranslator(TranslationAPI):
     """OpenRouter API翻译器，支持多种最新模型"""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.api_key = self.settings.value("openrouter/api_key", "")
-        # 支持各种最新模型
-        self.model = self.settings.value("openrouter/model", "anthropic/claude-3-opus:beta")
-        self.base_url = self.settings.value("openrouter/base_url", "https://openrouter.ai/api/v1/chat/completions")
+    SETTINGS_PREFIX = "openrouter"
+    DEFAULT_MODEL = "anthropic/claude-3-opus:beta"  # 支持各种最新模型
+    DEFAULT_URL = "https://openrouter.ai/api/v1/chat/completions"
     
-    def set_api_key(self, api_key):
-        """设置API密钥"""
-        self.api_key = api_key
-        self.settings.setValue("openrouter/api_key", api_key)
-    
-    def set_model(self, model):
-        """设置模型名称"""
-        self.model = model
-        self.settings.setValue("openrouter/model", model)
+    def build_headers(self):
+        """构建请求头"""
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+            "HTTP-Referer": "https://hdctranslator.app",
+            "X-Title": "HDCTranslator"
+        }
     
-    def set_base_url(self, base_url):
-        """设置API基础URL"""
-        self.base_url = base_url
-        self.settings.setValue("openrouter/base_url", base_url)
+    def build_request_template(self):
+        """构建不含待译文本的请求体模板"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "你是一名专业翻译，将以下英文文本翻译成优雅流畅的中文。保留原文的意思和语调。只返回翻译结果，不要添加解释或额外内容。"}
+            ],
+            "temperature": 0.3
+        }
     
     def translate(self, text):
         """使用OpenRouter API翻译文本并保护占位符"""
@@ -414,26 +891,10 @@ class OpenRouterTranslator(TranslationAPI):
             return ""
         
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "HTTP-Referer": "https://hdctranslator.app",
-                "X-Title": "HDCTranslator"
-            }
-            
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "你是一名专业翻译，将以下英文文本翻译成优雅流畅的中文。保留原文的意思和语调。只返回翻译结果，不要添加解释或额外内容。"},
-                    {"role": "user", "content": text}
-                ],
-                "temperature": 0.3
-            }
-            
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
-            response.raise_for_status()
+            template = self.get_request_template()
+            data = dict(template, messages=template["messages"] + [{"role": "user", "content": text}])
             
-            result = response.json()
+            result = self._post_json(data, timeout=30)
             if "choices" in result and len(result["choices"]) > 0:
                 return result["choices"][0]["message"]["content"].strip()
             else:
@@ -453,12 +914,6 @@ class OpenRouterTranslator(TranslationAPI):
         try:
             # 使用一个简单的文本进行测试
             test_text = "Hello, this is a test."
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-                "HTTP-Referer": "https://hdctranslator.app",
-                "X-Title": "HDCTranslator"
-            }
             
             data = {
                 "model": self.model,
@@ -469,8 +924,7 @@ class OpenRouterTranslator(TranslationAPI):
                 "max_tokens": 50
             }
             
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=10)
-            response.raise_for_status()
+            self._post_json(data, timeout=10)
             
             return True
                 
@@ -482,27 +936,26 @@ class OpenRouterTranslator(TranslationAPI):
 class DeepSeekTranslator(TranslationAPI):
     """DeepSeek API翻译器，支持最新中英双语模型"""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.api_key = self.settings.value("deepseek/api_key", "")
-        # 使用最新的DeepSeek模型
-        self.model = self.settings.value("deepseek/model", "deepseek-chat")
-        self.base_url = self.settings.value("deepseek/base_url", "https://api.deepseek.com/v1/chat/completions")
-    
-    def set_api_key(self, api_key):
-        """设置API密钥"""
-        self.api_key = api_key
-        self.settings.setValue("deepseek/api_key", api_key)
+    SETTINGS_PREFIX = "deepseek"
+    DEFAULT_MODEL = "deepseek-chat"  # 使用最新的DeepSeek模型
+    DEFAULT_URL = "https://api.deepseek.com/v1/chat/completions"
     
-    def set_model(self, model):
-        """设置模型名称"""
-        self.model = model
-        self.settings.setValue("deepseek/model", model)
+    def build_headers(self):
+        """构建请求头"""
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
     
-    def set_base_url(self, base_url):
-        """设置API基础URL"""
-        self.base_url = base_url
-        self.settings.setValue("deepseek/base_url", base_url)
+    def build_request_template(self):
+        """构建不含待译文本的请求体模板"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "你是一名专业翻译，将以下英文文本翻译成优雅流畅的中文。保留原文的意思和语调。只返回翻译结果，不要添加解释或额外内容。"}
+            ],
+            "temperature": 0.3
+        }
     
     def translate(self, text):
         """使用DeepSeek API翻译文本并保护占位符"""
@@ -516,24 +969,10 @@ class DeepSeekTranslator(TranslationAPI):
             return ""
         
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
+            template = self.get_request_template()
+            data = dict(template, messages=template["messages"] + [{"role": "user", "content": text}])
             
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "你是一名专业翻译，将以下英文文本翻译成优雅流畅的中文。保留原文的意思和语调。只返回翻译结果，不要添加解释或额外内容。"},
-                    {"role": "user", "content": text}
-                ],
-                "temperature": 0.3
-            }
-            
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
+            result = self._post_json(data, timeout=30)
             if "choices" in result and len(result["choices"]) > 0:
                 return result["choices"][0]["message"]["content"].strip()
             else:
@@ -553,10 +992,6 @@ class DeepSeekTranslator(TranslationAPI):
         try:
             # 使用一个简单的文本进行测试
             test_text = "Hello, this is a test."
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
             
             data = {
                 "model": self.model,
@@ -567,8 +1002,7 @@ class DeepSeekTranslator(TranslationAPI):
                 "max_tokens": 50
             }
             
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=10)
-            response.raise_for_status()
+            self._post_json(data, timeout=10)
             
             return True
                 
@@ -7,17 +7,93 @@
 """
 
 import os
+import re
 import json
-import time
-import random
-import requests
-from dotenv import load_dotenv
-from PyQt6.QtCore import QObject, pyqtSignal
+import threading
+import itertools
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
 
-# 加载环境变量中的API密钥
-load_dotenv()
+# 可选使用orjson加速请求体序列化和响应解析，未安装时使用标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-import re
+
+def _dumps(data):
+    """将请求体序列化为UTF-8编码的JSON字节串"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(content):
+    """解析JSON响应内容"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# 文本包含占位符标记时附加到提示中的说明
+_PLACEHOLDER_PROMPT = "文本中包含特殊标记格式为 __PLACEHOLDER_X__，这些是原始代码中的变量占位符，必须在翻译时完全保留。请勿翻译这些标记或尝试理解其含义，只需在输出中原样保留它们。这些标记会在后续处理中被还原为程序需要的格式。"
+
+# 匹配[xxx]格式的占位符，安装了google-re2时使用线性时间的RE2引擎
+try:
+    import re2
+    _PLACEHOLDER_RE = re2.compile(r'\[([^\]]+)\]')
+except ImportError:
+    _PLACEHOLDER_RE = re.compile(r'\[([^\]]+)\]')
+
+# 匹配protect_placeholders生成的特殊标记
+_MARKER_RE = re.compile(r'__PLACEHOLDER_\d+__')
+
+# 预先生成常用数量的标记，避免逐个格式化
+_MARKERS = tuple(f"__PLACEHOLDER_{i}__" for i in range(1024))
+
+# 模型误译的占位符及其原始形式
+_CORRECTIONS = {
+    '[姓名]': '[name]',
+    '[名字]': '[name]',
+    '[人名]': '[name]',
+    '[用户]': '[name]',
+    '[玩家]': '[name]',
+    '[角色]': '[character]',
+    '[数值]': '[value]',
+    '[数字]': '[number]',
+    '[地点]': '[location]',
+    '[物品]': '[item]',
+    '[武器]': '[weapon]'
+}
+
+# 一次扫描匹配所有误译占位符
+_CORRECTIONS_RE = re.compile('|'.join(re.escape(wrong) for wrong in _CORRECTIONS))
+
+@functools.lru_cache(maxsize=512)
+def _protect_placeholders(text):
+    """
+    将文本中的[xxx]占位符按出现顺序替换为唯一标记
+    
+    Args:
+        text: 原始文本
+        
+    Returns:
+        tuple: (处理后的文本, ((标记, 占位符), ...))
+    """
+    placeholder_items = []
+    counter = itertools.count()
+    
+    def replace(match):
+        i = next(counter)
+        marker = _MARKERS[i] if i < len(_MARKERS) else f"__PLACEHOLDER_{i}__"
+        placeholder_items.append((marker, match.group(0)))
+        return marker
+    
+    # 一次扫描完成所有占位符的替换
+    processed_text = _PLACEHOLDER_RE.sub(replace, text)
+    
+    return processed_text, tuple(placeholder_items)
 
 class TranslatorManager(QObject):
     """翻译管理器，集成多种翻译API"""
@@ -25,6 +101,16 @@ class TranslatorManager(QObject):
     # 定义信号
     translation_completed = pyqtSignal(str, str)  # 原文, 译文
     error_occurred = pyqtSignal(str)  # 错误信息
+    translation_chunk_received = pyqtSignal(str, str, bool)  # 原文, 已收到的译文, 是否结束
+    
+    # 一条文本中多个片段同时请求的默认并发数
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # 后台翻译线程池，translate_async提交的请求在其中执行
+    _executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+    
+    # 翻译结果缓存的最大条目数
+    CACHE_SIZE = 4096
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -36,15 +122,39 @@ class TranslatorManager(QObject):
         self.custom_api_params = {}
         
         # 占位符相关
-        self.placeholder_pattern = r'\[([^\]]+)\]'  # 匹配[xxx]格式的占位符
+        self.placeholder_pattern = _PLACEHOLDER_RE.pattern  # 匹配[xxx]格式的占位符
         self.placeholders = {}  # 存储占位符映射
         
+        # 复用HTTP连接，避免每次请求重新进行TCP/TLS握手(首次请求时创建)
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # 翻译结果缓存: (API类型, 模型, 目标语言, 源语言, 原文) -> 译文
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # 缓存自上次写入文件后是否有新条目
+        self._cache_dirty = False
+        
         # 加载配置
-        self.config_file = os.path.join(
+        settings_dir = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "settings", "api_config.json"
+            "settings"
         )
+        self.config_file = os.path.join(settings_dir, "api_config.json")
+        self.cache_file = os.path.join(settings_dir, "translation_cache.json")
         self.load_config()
+        self.load_cache()
+        
+        # 配置延迟保存定时器
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self.save_config)
+        
+        # 应用退出时保存尚未写入的配置和翻译缓存，调用方无需显式调用close
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.close)
     
     def load_config(self):
         """从配置文件加载API设置"""
@@ -73,14 +183,51 @@ class TranslatorManager(QObject):
                 'custom_params': self.custom_api_params
             }
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            # 先写入临时文件再替换，避免写入中断导致配置文件损坏
+            temp_file = self.config_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(config, f, ensure_ascii=False, indent=4)
-                
+            os.replace(temp_file, self.config_file)
+            
+            self.save_cache()
             return True
         except Exception as e:
             self.error_occurred.emit(f"保存API配置失败: {str(e)}")
             return False
     
+    def load_cache(self):
+        """从缓存文件加载已有的翻译结果"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                
+                with self._cache_lock:
+                    for key, translation in entries[-self.CACHE_SIZE:]:
+                        self._cache[tuple(key)] = translation
+        except Exception as e:
+            self.error_occurred.emit(f"加载翻译缓存失败: {str(e)}")
+    
+    def save_cache(self):
+        """保存翻译结果缓存到文件"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            
+            with self._cache_lock:
+                entries = [[list(key), translation] for key, translation in self._cache.items()]
+                self._cache_dirty = False
+            
+            # 先写入临时文件再替换，避免写入中断导致缓存文件损坏
+            temp_file = self.cache_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+            
+            return True
+        except Exception as e:
+            self.error_occurred.emit(f"保存翻译缓存失败: {str(e)}")
+            return False
+    
     def set_api(self, api_type, api_key=None, api_endpoint=None, custom_params=None):
         """
         设置API类型和参数
@@ -101,7 +248,9 @@ class TranslatorManager(QObject):
         if custom_params:
             self.custom_api_params = custom_params
         
-        return self.save_config()
+        # 延迟保存，连续多次设置只写入一次配置文件
+        self._save_timer.start()
+        return True
     
     def protect_placeholders(self, text):
         """
@@ -113,72 +262,35 @@ class TranslatorManager(QObject):
         Returns:
             tuple: (处理后的文本, 占位符映射字典)
         """
-        # 清空之前的占位符映射
-        self.placeholders = {}
-        
-        # 查找所有[xxx]格式的占位符
-        processed_text = text
-        placeholder_matches = re.finditer(self.placeholder_pattern, text)
-        
-        # 收集所有占位符，以便后续按长度排序处理（避免替换子字符串问题）
-        placeholder_list = []
-        for i, match in enumerate(placeholder_matches):
-            # 生成唯一标记
-            placeholder = match.group(0)  # 完整的[xxx]
-            placeholder_list.append((placeholder, i))
-        
-        # 按长度倒序排列，先替换较长的占位符
-        placeholder_list.sort(key=lambda x: len(x[0]), reverse=True)
-        
-        # 执行替换
-        for placeholder, i in placeholder_list:
-            marker = f"__PLACEHOLDER_{i}__"
-            
-            # 存储映射关系
-            self.placeholders[marker] = placeholder
-            
-            # 替换文本中的占位符
-            processed_text = processed_text.replace(placeholder, marker)
+        # 相同文本直接复用缓存的处理结果
+        processed_text, placeholder_items = _protect_placeholders(text)
+        self.placeholders = dict(placeholder_items)
         
         return processed_text, self.placeholders
     
-    def restore_placeholders(self, translated_text):
+    def restore_placeholders(self, translated_text, placeholders=None):
         """
         将译文中的特殊标记还原为原始占位符
         
         Args:
             translated_text: 包含特殊标记的译文
+            placeholders: 标记到占位符的映射，默认使用最近一次protect_placeholders的结果
             
         Returns:
             str: 还原占位符后的译文
         """
+        if placeholders is None:
+            placeholders = self.placeholders
+        
         result = translated_text
         
-        # 按照占位符标记的格式查找
-        for marker, placeholder in self.placeholders.items():
-            result = result.replace(marker, placeholder)
+        # 一次扫描将所有特殊标记还原为占位符
+        if placeholders:
+            result = _MARKER_RE.sub(lambda match: placeholders.get(match.group(0), match.group(0)), result)
         
         # 执行常见的翻译错误修正
         # 将翻译模型可能翻译的占位符转换回原始形式
-        common_translations = {
-            '[姓名]': '[name]',
-            '[名字]': '[name]',
-            '[人名]': '[name]',
-            '[用户]': '[name]',
-            '[玩家]': '[name]',
-            '[角色]': '[character]',
-            '[数值]': '[value]',
-            '[数字]': '[number]',
-            '[地点]': '[location]',
-            '[物品]': '[item]',
-            '[武器]': '[weapon]'
-        }
-        
-        # 执行替换
-        for translated, original in common_translations.items():
-            result = result.replace(translated, original)
-        
-        return result
+        return _CORRECTIONS_RE.sub(lambda match: _CORRECTIONS[match.group(0)], result)
     
     def translate(self, text, target_lang="zh", source_lang="en"):
         """
@@ -195,27 +307,83 @@ class TranslatorManager(QObject):
         if not text or not text.strip():
             return ""
             
-        # 直接提取所有[xxx]格式的占位符
-        placeholder_pattern = r'\[([^\]]+)\]'
-        placeholders = re.findall(placeholder_pattern, text)
+        # 不含"["的文本不可能有占位符，无需正则扫描
+        # 否则一次扫描找出所有[xxx]格式的占位符，同时用于计数和分割
+        matches = list(_PLACEHOLDER_RE.finditer(text)) if '[' in text else []
         
-        if not placeholders:
+        if not matches:
             # 没有占位符，直接翻译整个文本
-            result = self._do_translate(text, target_lang, source_lang)
+            result = self._do_translate(text, target_lang, source_lang, stream_source=(text, None))
+            self.translation_chunk_received.emit(text, result, True)
             if result:
                 self.translation_completed.emit(text, result)
             return result
         
-        print(f"发现 {len(placeholders)} 个占位符")
+        print(f"发现 {len(matches)} 个占位符")
+        
+        # 将占位符替换为特殊标记，整条文本只请求一次
+        protected_text, placeholders = self.protect_placeholders(text)
+        translated = self._do_translate(protected_text, target_lang, source_lang, has_placeholders=True,
+                                        stream_source=(text, placeholders))
+        
+        if all(marker in translated for marker in placeholders):
+            result = translated
+        else:
+            # 模型未能原样保留标记时，退回到按占位符分段翻译
+            result = self._translate_by_segments(text, matches, target_lang, source_lang)
+        
+        # 还原占位符并修正常见错误（以防某些API仍然翻译了占位符）
+        result = self.restore_placeholders(result, placeholders)
+        
+        # 发出翻译完成信号，流式信号的结束通知只以最终结果发出一次
+        self.translation_chunk_received.emit(text, result, True)
+        if result:
+            self.translation_completed.emit(text, result)
+        
+        return result
+    
+    def translate_async(self, text, target_lang="zh", source_lang="en"):
+        """
+        在后台线程中翻译文本，不阻塞调用线程
+        
+        翻译结果通过translation_completed信号返回，Qt会将跨线程的信号
+        排队投递到接收者所在的线程
+        
+        Args:
+            text: 要翻译的文本
+            target_lang: 目标语言代码
+            source_lang: 源语言代码
+        """
+        self._executor.submit(self._translate_in_background, text, target_lang, source_lang)
+    
+    def _translate_in_background(self, text, target_lang, source_lang):
+        """后台线程中执行翻译，捕获异常并通过信号报告"""
+        try:
+            self.translate(text, target_lang, source_lang)
+        except Exception as e:
+            self.error_occurred.emit(f"翻译失败: {str(e)}")
+    
+    def _translate_by_segments(self, text, matches, target_lang="zh", source_lang="en"):
+        """
+        按占位符将文本分段，只翻译文本片段并保留占位符
         
+        Args:
+            text: 要翻译的文本
+            matches: 文本中占位符的匹配结果列表
+            target_lang: 目标语言代码
+            source_lang: 源语言代码
+            
+        Returns:
+            str: 拼接后的译文
+        """
         # 将原文分割成文本片段和占位符
         segments = []
         last_end = 0
         
         # 按顺序查找占位符的位置
-        for match in re.finditer(placeholder_pattern, text):
+        for match in matches:
             start, end = match.span()
-            placeholder = match.group(0)  # 完整的[xxx]
+            placeholder = text[start:end]  # 完整的[xxx]，直接切片比group(0)更快
             
             # 添加占位符前的文本（如果有）
             if start > last_end:
@@ -234,63 +402,102 @@ class TranslatorManager(QObject):
             if text_after.strip():
                 segments.append({"type": "text", "content": text_after})
         
-        # 只翻译文本部分，保留占位符
-        result = ""
+        # 只翻译文本部分，保留占位符；各文本片段并发请求
+        text_segments = [segment["content"] for segment in segments if segment["type"] == "text"]
+        translations = iter(self._translate_segments(text_segments, target_lang, source_lang))
+        
+        parts = []
         for segment in segments:
             if segment["type"] == "text":
-                # 翻译文本
-                translated = self._do_translate(segment["content"], target_lang, source_lang)
-                result += translated
+                parts.append(next(translations))
             else:
                 # 原样保留占位符
-                result += segment["content"]
-        
-        # 检查常见错误并修正（以防某些API仍然翻译了占位符）
-        corrections = {
-            '[姓名]': '[name]', 
-            '[名字]': '[name]',
-            '[人名]': '[name]',
-            '[用户]': '[name]',
-            '[玩家]': '[name]',
-            '[角色]': '[character]',
-            '[数值]': '[value]',
-            '[数字]': '[number]',
-            '[地点]': '[location]',
-            '[物品]': '[item]',
-            '[武器]': '[weapon]'
-        }
+                parts.append(segment["content"])
+        return "".join(parts)
+    
+    def _translate_segments(self, segments, target_lang="zh", source_lang="en"):
+        """
+        并发翻译多个文本片段，并发数由custom_params中的concurrency控制
+        
+        Args:
+            segments: 文本片段列表
+            target_lang: 目标语言代码
+            source_lang: 源语言代码
+            
+        Returns:
+            list: 与输入顺序一致的译文列表
+        """
+        if len(segments) <= 1:
+            return [self._do_translate(segment, target_lang, source_lang) for segment in segments]
+        
+        max_workers = min(len(segments), self.custom_api_params.get("concurrency", self.MAX_CONCURRENT_REQUESTS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda segment: self._do_translate(segment, target_lang, source_lang),
+                segments
+            ))
+    
+    def _do_translate(self, text, target_lang="zh", source_lang="en", has_placeholders=False, stream_source=None):
+        """
+        执行实际的翻译
         
-        for wrong, correct in corrections.items():
-            result = result.replace(wrong, correct)
+        Args:
+            text: 要翻译的文本
+            target_lang: 目标语言代码
+            source_lang: 源语言代码
+            has_placeholders: 文本中是否包含占位符标记
+            stream_source: (调用者的原文, 占位符映射)，为None时不发出流式译文信号
+            
+        Returns:
+            str: 翻译结果
+        """
+        if self.api_type == "None":
+            # 如果没有配置API，返回原文
+            return text
         
-        # 发出翻译完成信号
-        if result:
-            self.translation_completed.emit(text, result)
+        key = (self.api_type, self.custom_api_params.get("model", ""), target_lang, source_lang, text)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        
+        result = self._request_translation(text, target_lang, source_lang, has_placeholders, stream_source)
+        
+        # 失败时返回的是原文，不缓存
+        if result and result != text:
+            with self._cache_lock:
+                self._cache[key] = result
+                self._cache.move_to_end(key)
+                self._cache_dirty = True
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
         
         return result
     
-    def _do_translate(self, text, target_lang="zh", source_lang="en"):
+    def _request_translation(self, text, target_lang="zh", source_lang="en", has_placeholders=False, stream_source=None):
         """
-        执行实际的翻译
+        调用当前API翻译文本，不经过缓存
         
         Args:
             text: 要翻译的文本
             target_lang: 目标语言代码
             source_lang: 源语言代码
+            has_placeholders: 文本中是否包含占位符标记
+            stream_source: (调用者的原文, 占位符映射)，为None时不发出流式译文信号
             
         Returns:
-            str: 翻译结果
+            str: 翻译结果，失败时返回原文
         """
         # 根据API类型调用不同的翻译方法
         try:
             if self.api_type == "OpenAI":
-                result = self._translate_with_openai(text, target_lang, False)
+                result = self._translate_with_openai(text, target_lang, has_placeholders, stream_source)
             elif self.api_type == "Claude":
-                result = self._translate_with_claude(text, target_lang, False)
+                result = self._translate_with_claude(text, target_lang, has_placeholders, stream_source)
             elif self.api_type == "DeepSeek":
-                result = self._translate_with_deepseek(text, target_lang, False)
+                result = self._translate_with_deepseek(text, target_lang, has_placeholders, stream_source)
             elif self.api_type == "OpenRouter":
-                result = self._translate_with_openrouter(text, target_lang, False)
+                result = self._translate_with_openrouter(text, target_lang, has_placeholders, stream_source)
             else:
                 # 如果没有配置API，返回原文
                 return text
@@ -300,7 +507,85 @@ class TranslatorManager(QObject):
             self.error_occurred.emit(f"翻译失败: {str(e)}")
             return text
     
-    def _translate_with_openai(self, text, target_lang, has_placeholders=False):
+    def _get_session(self):
+        """
+        获取HTTP会话，首次调用时才导入requests并创建带连接池的会话
+        
+        Returns:
+            requests.Session: HTTP会话
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+    
+    def _read_stream(self, response, stream_source=None, claude=False):
+        """
+        逐行读取SSE流式响应，每收到一段译文就发出translation_chunk_received信号
+        
+        信号以调用者的原文为键，已收到的译文先还原占位符再发出；
+        按占位符分段翻译时各片段只是原文的一部分，不发出信号。
+        结束通知由translate以最终结果发出，这里只发出未结束的部分译文
+        
+        Args:
+            response: 以stream=True发送请求得到的响应
+            stream_source: (调用者的原文, 占位符映射)，为None时不发出信号
+            claude: 是否为Claude格式的事件流
+            
+        Returns:
+            str: 完整译文，未收到任何内容时返回空字符串
+        """
+        received = ""
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == b"[DONE]":
+                break
+            
+            event = _loads(payload)
+            if claude:
+                # Claude的译文增量在content_block_delta事件中
+                if event.get("type") != "content_block_delta":
+                    continue
+                delta = event.get("delta", {}).get("text", "")
+            else:
+                choices = event.get("choices")
+                if not choices:
+                    continue
+                delta = choices[0].get("delta", {}).get("content") or ""
+            
+            if delta:
+                received += delta
+                self._emit_chunk(stream_source, received)
+        
+        return received.strip()
+    
+    def _emit_chunk(self, stream_source, received):
+        """
+        以调用者的原文为键发出未结束的translation_chunk_received信号
+        
+        Args:
+            stream_source: (调用者的原文, 占位符映射)，为None时不发出信号
+            received: 已收到的译文
+        """
+        if stream_source is None:
+            return
+        source, placeholders = stream_source
+        if placeholders:
+            # 与最终结果一样还原占位符，避免把特殊标记显示给用户
+            received = self.restore_placeholders(received, placeholders)
+        self.translation_chunk_received.emit(source, received, False)
+    
+    def _translate_with_openai(self, text, target_lang, has_placeholders=False, stream_source=None):
         """
         使用OpenAI API进行翻译
         
@@ -308,6 +593,7 @@ class TranslatorManager(QObject):
             text: 要翻译的文本
             target_lang: 目标语言
             has_placeholders: 是否包含占位符
+            stream_source: (调用者的原文, 占位符映射)，为None时不发出流式译文信号
             
         Returns:
             str: 翻译结果
@@ -332,7 +618,7 @@ class TranslatorManager(QObject):
         
         # 如果文本包含占位符，添加特殊说明
         if has_placeholders:
-            system_prompt += f"文本中包含特殊标记格式为 __PLACEHOLDER_X__，这些是原始代码中的变量占位符，必须在翻译时完全保留。请勿翻译这些标记或尝试理解其含义，只需在输出中原样保留它们。这些标记会在后续处理中被还原为程序需要的格式。"
+            system_prompt += _PLACEHOLDER_PROMPT
         
         # 从custom_api_params获取模型名称，如果没有则使用默认值
         model = self.custom_api_params.get("model", "gpt-4o")
@@ -349,20 +635,22 @@ class TranslatorManager(QObject):
                     "content": text
                 }
             ],
-            "temperature": 0.3
+            "temperature": 0.3,
+            "stream": True
         }
         
-        response = requests.post(endpoint, headers=headers, json=data)
-        
-        if response.status_code == 200:
-            resp_json = response.json()
-            translation = resp_json["choices"][0]["message"]["content"].strip()
-            return translation
-        else:
-            self.error_occurred.emit(f"OpenAI API错误: {response.status_code}, {response.text}")
-            return text
-            
-    def _translate_with_claude(self, text, target_lang, has_placeholders=False):
+        with self._get_session().post(endpoint, headers=headers, data=_dumps(data), stream=True) as response:
+            if response.status_code == 200:
+                translation = self._read_stream(response, stream_source)
+                if translation:
+                    return translation
+                self.error_occurred.emit("OpenAI API返回了无效的响应格式")
+                return text
+            else:
+                self.error_occurred.emit(f"OpenAI API错误: {response.status_code}, {response.content.decode('utf-8', 'replace')}")
+                return text
+    
+    def _translate_with_claude(self, text, target_lang, has_placeholders=False, stream_source=None):
         """
         使用Claude API进行翻译
         
@@ -370,6 +658,7 @@ class TranslatorManager(QObject):
             text: 要翻译的文本
             target_lang: 目标语言
             has_placeholders: 是否包含占位符
+            stream_source: (调用者的原文, 占位符映射)，为None时不发出流式译文信号
             
         Returns:
             str: 翻译结果
@@ -391,7 +680,13 @@ class TranslatorManager(QObject):
         # 准备提示文本
         language_name = "中文" if target_lang == "zh" else target_lang
         
-        user_content = f"将以下英文文本翻译成优雅流畅的{language_name}，保留原始格式，只返回翻译结果，不要添加任何解释或额外内容。\n\n{text}"
+        instruction = f"将以下英文文本翻译成优雅流畅的{language_name}，保留原始格式，只返回翻译结果，不要添加任何解释或额外内容。"
+        
+        # 如果文本包含占位符，添加特殊说明
+        if has_placeholders:
+            instruction += _PLACEHOLDER_PROMPT
+        
+        user_content = f"{instruction}\n\n{text}"
         
         # 从custom_api_params获取模型名称，如果没有则使用默认值
         model = self.custom_api_params.get("model", "claude-3-opus-20240229")
@@ -405,30 +700,23 @@ class TranslatorManager(QObject):
                 }
             ],
             "temperature": 0.3,
-            "max_tokens": 4000
+            "max_tokens": 4000,
+            "stream": True
         }
         
-        response = requests.post(endpoint, headers=headers, json=data)
-        
-        if response.status_code == 200:
-            resp_json = response.json()
-            if "content" in resp_json and len(resp_json["content"]) > 0:
-                for item in resp_json["content"]:
-                    if item.get("type") == "text":
-                        translation = item.get("text", "").strip()
-                        return translation
-            
-            # 尝试旧版格式
-            if "completion" in resp_json:
-                return resp_json["completion"].strip()
-                
-            self.error_occurred.emit("Claude API返回了无效的响应格式")
-            return text
-        else:
-            self.error_occurred.emit(f"Claude API错误: {response.status_code}, {response.text}")
-            return text
+        with self._get_session().post(endpoint, headers=headers, data=_dumps(data), stream=True) as response:
+            if response.status_code == 200:
+                translation = self._read_stream(response, stream_source, claude=True)
+                if translation:
+                    return translation
             
-    def _translate_with_deepseek(self, text, target_lang, has_placeholders=False):
+                self.error_occurred.emit("Claude API返回了无效的响应格式")
+                return text
+            else:
+                self.error_occurred.emit(f"Claude API错误: {response.status_code}, {response.content.decode('utf-8', 'replace')}")
+                return text
+    
+    def _translate_with_deepseek(self, text, target_lang, has_placeholders=False, stream_source=None):
         """
         使用DeepSeek API进行翻译
         
@@ -436,6 +724,7 @@ class TranslatorManager(QObject):
             text: 要翻译的文本
             target_lang: 目标语言
             has_placeholders: 是否包含占位符
+            stream_source: (调用者的原文, 占位符映射)，为None时不发出流式译文信号
             
         Returns:
             str: 翻译结果
@@ -458,6 +747,10 @@ class TranslatorManager(QObject):
         
         system_prompt = f"你是一名专业翻译，将以下英文文本翻译成优雅流畅的{language_name}。保留原始格式，只返回翻译结果，不要添加解释或额外内容。"
         
+        # 如果文本包含占位符，添加特殊说明
+        if has_placeholders:
+            system_prompt += _PLACEHOLDER_PROMPT
+        
         # 从custom_api_params获取模型名称，如果没有则使用默认值
         model = self.custom_api_params.get("model", "deepseek-chat")
         
@@ -473,24 +766,23 @@ class TranslatorManager(QObject):
                     "content": text
                 }
             ],
-            "temperature": 0.3
+            "temperature": 0.3,
+            "stream": True
         }
         
-        response = requests.post(endpoint, headers=headers, json=data)
-        
-        if response.status_code == 200:
-            resp_json = response.json()
-            if "choices" in resp_json and len(resp_json["choices"]) > 0:
-                translation = resp_json["choices"][0]["message"]["content"].strip()
-                return translation
+        with self._get_session().post(endpoint, headers=headers, data=_dumps(data), stream=True) as response:
+            if response.status_code == 200:
+                translation = self._read_stream(response, stream_source)
+                if translation:
+                    return translation
+                else:
+                    self.error_occurred.emit("DeepSeek API返回了无效的响应格式")
+                    return text
             else:
-                self.error_occurred.emit("DeepSeek API返回了无效的响应格式")
+                self.error_occurred.emit(f"DeepSeek API错误: {response.status_code}, {response.content.decode('utf-8', 'replace')}")
                 return text
-        else:
-            self.error_occurred.emit(f"DeepSeek API错误: {response.status_code}, {response.text}")
-            return text
     
-    def _translate_with_openrouter(self, text, target_lang, has_placeholders=False):
+    def _translate_with_openrouter(self, text, target_lang, has_placeholders=False, stream_source=None):
         """
         使用OpenRouter API进行翻译
         
@@ -498,6 +790,7 @@ class TranslatorManager(QObject):
             text: 要翻译的文本
             target_lang: 目标语言
             has_placeholders: 是否包含占位符
+            stream_source: (调用者的原文, 占位符映射)，为None时不发出流式译文信号
             
         Returns:
             str: 翻译结果
@@ -525,6 +818,10 @@ class TranslatorManager(QObject):
         
         system_prompt = f"你是一名专业翻译，将以下英文文本翻译成优雅流畅的{language_name}。保留原始格式，只返回翻译结果，不要添加解释或额外内容。"
         
+        # 如果文本包含占位符，添加特殊说明
+        if has_placeholders:
+            system_prompt += _PLACEHOLDER_PROMPT
+        
         data = {
             "model": model,
             "messages": [
@@ -537,22 +834,32 @@ class TranslatorManager(QObject):
                     "content": text
                 }
             ],
-            "temperature": 0.3
+            "temperature": 0.3,
+            "stream": True
         }
         
-        response = requests.post(endpoint, headers=headers, json=data)
-        
-        if response.status_code == 200:
-            resp_json = response.json()
-            if "choices" in resp_json and len(resp_json["choices"]) > 0:
-                translation = resp_json["choices"][0]["message"]["content"].strip()
-                return translation
+        with self._get_session().post(endpoint, headers=headers, data=_dumps(data), stream=True) as response:
+            if response.status_code == 200:
+                translation = self._read_stream(response, stream_source)
+                if translation:
+                    return translation
+                else:
+                    self.error_occurred.emit("OpenRouter API返回了无效的响应格式")
+                    return text
             else:
-                self.error_occurred.emit("OpenRouter API返回了无效的响应格式")
+                self.error_occurred.emit(f"OpenRouter API错误: {response.status_code}, {response.content.decode('utf-8', 'replace')}")
                 return text
-        else:
-            self.error_occurred.emit(f"OpenRouter API错误: {response.status_code}, {response.text}")
-            return text
+    
+    def close(self):
+        """保存尚未写入的配置和翻译缓存，关闭HTTP会话并释放连接池"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_config()
+        elif self._cache_dirty:
+            # save_config已包含缓存，这里只处理会话中没有修改配置的情况
+            self.save_cache()
+        if self._session is not None:
+            self._session.close()
     
     def test_connection(self):
         """
@@ -582,7 +889,10 @@ class TranslatorManager(QObject):
 # 测试代码
 if __name__ == "__main__":
     import sys
-    from PyQt6.QtCore import QCoreApplication
+    from dotenv import load_dotenv
+    
+    # 加载环境变量中的API密钥
+    load_dotenv()
     
     app = QCoreApplication(sys.argv)
     
@@ -603,4 +913,5 @@ if __name__ == "__main__":
     else:
         print("没有找到OpenAI API密钥，跳过测试")
     
+    translator.close()
     sys.exit(0)
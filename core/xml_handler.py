@@ -8,10 +8,146 @@ XML处理模块
 
 import os
 import re
+import sys
+import time
+import itertools
+import zipfile
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from lxml import etree
-import pandas as pd
 from PyQt6.QtCore import QObject, pyqtSignal
 
+# 可选使用pygixml(pugixml)加速XML解析，未安装时使用lxml流式解析
+try:
+    import pygixml
+except ImportError:
+    pygixml = None
+
+# 物品标签识别：ID第二段(如entityname.weapon_xxx中的weapon_xxx)以类别前缀开头，
+# 或包含某类关键词；关键词按表中顺序判断，只归入第一个命中的类别
+_ITEM_PREFIX_TAGS = ('weapon', 'tool', 'medical', 'suit', 'item', 'creature', 'material')
+_ITEM_KEYWORDS = (
+    ('weapon', ('gun', 'rifle', 'pistol')),
+    ('medical', ('medic', 'health', 'bandage')),
+    ('suit', ('armor', 'helmet')),
+    ('creature', ('monster', 'alien')),
+)
+
+
+def _build_item_tag_patterns():
+    """
+    为每个物品标签生成一个正则，在以换行拼接的所有ID上扫描一次即可判断该标签是否出现
+    
+    Returns:
+        tuple: (标签, 正则)元组
+    """
+    patterns = []
+    for tag in _ITEM_PREFIX_TAGS:
+        alternatives = [re.escape(tag) + '_']
+        higher = []  # 优先级更高的类别关键词，命中它们的ID不归入当前类别
+        for keyword_tag, keywords in _ITEM_KEYWORDS:
+            if keyword_tag == tag:
+                exclude = f"(?![^.\\n]*(?:{'|'.join(higher)}))" if higher else ''
+                alternatives.append(f"{exclude}[^.\\n]*(?:{'|'.join(keywords)})")
+                break
+            higher.extend(keywords)
+        patterns.append((tag, re.compile(r'^[^.\n]*\.(?:' + '|'.join(alternatives) + ')', re.MULTILINE)))
+    return tuple(patterns)
+
+
+_ITEM_TAG_PATTERNS = _build_item_tag_patterns()
+
+# 写出XML和Excel文件时使用的缓冲区大小(1 MiB)，减少大文件输出时的系统调用次数
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# xlsx文件内部XML使用的命名空间，用于直接读取工作表数据
+_XLSX_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_XLSX_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+# 物品类别关键词映射 - 使用英文键名匹配UI中的标签
+_CATEGORY_KEYWORDS = {
+    "weapon": ["weapon", "gun", "rifle", "pistol", "shotgun", "smg", "revolver", "coilgun", "railgun", "explosive", "grenade", "launcher", "machinegun", "carbine", "assault", "sniper"],
+    "tool": ["tool", "cutter", "welder", "screwdriver", "wrench", "crowbar", "repair", "extinguisher", "knife", "axe", "mace", "sword"],
+    "medical": ["medical", "medic", "bandage", "health", "firstaid", "antidote", "medicine", "cure", "stim", "heal", "affliction"],
+    "suit": ["suit", "diving", "armor", "uniform", "clothes", "helmet", "gear", "outfit", "exoskeleton", "ballistichelmet", "bodyarmor", "tactical"],
+    "item": ["round", "ammo", "magazine", "shell", "bullet", "clip", "explosive", "dart", "rocket", "grenade", "cartridge"],
+    "material": ["material", "resource", "steel", "plastic", "rubber", "fabric", "organic", "alien", "barrel", "reciever", "gunpowder"],
+    "creature": ["creature", "monster", "animal", "alien", "moloch", "endworm", "crawler", "husk", "affliction"]
+}
+
+# 每个类别的关键词合并为一个正则，一次扫描即可判断是否命中任一关键词
+_CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+
+
+def _xlsx_text(element):
+    """
+    读取xlsx共享字符串或内联字符串节点的纯文本，与openpyxl的处理一致
+    
+    Args:
+        element: si或is节点
+        
+    Returns:
+        str: 去掉格式后的文本
+    """
+    plain = element.findtext(_XLSX_MAIN_NS + 't') or ''
+    runs = ''.join(run.findtext(_XLSX_MAIN_NS + 't') or '' for run in element.iterfind(_XLSX_MAIN_NS + 'r'))
+    return plain + runs
+
+
+class Entry:
+    """
+    单个翻译条目，数据存放在XMLHandler的列数组中
+    
+    通过属性(entry.original)访问，同时兼容字典方式(entry['original'])读写
+    """
+    
+    __slots__ = ('_handler', '_index')
+    
+    def __init__(self, handler, index):
+        self._handler = handler
+        self._index = index
+    
+    @property
+    def type(self):
+        return self._handler._types[self._index]
+    
+    # ID直接使用标签
+    id = type
+    
+    @property
+    def original(self):
+        return self._handler._originals[self._index]
+    
+    @property
+    def translation(self):
+        return self._handler._translations[self._index]
+    
+    @translation.setter
+    def translation(self, value):
+        self._handler._set_translation(self._index, value)
+        self._handler._invalidate_caches()
+    
+    def __getitem__(self, key):
+        if key == 'type' or key == 'id':
+            return self._handler._types[self._index]
+        if key == 'original':
+            return self._handler._originals[self._index]
+        if key == 'translation':
+            return self._handler._translations[self._index]
+        raise KeyError(key)
+    
+    def __setitem__(self, key, value):
+        if key != 'translation':
+            raise KeyError(key)
+        self.translation = value
+
+
 class XMLHandler(QObject):
     """处理潜渊症本地化XML文件的类"""
     
@@ -19,16 +155,37 @@ class XMLHandler(QObject):
     progress_updated = pyqtSignal(int, str)  # 进度值, 描述
     error_occurred = pyqtSignal(str)  # 错误信息
     
+    # 筛选结果缓存保留的最大查询数
+    FILTER_CACHE_SIZE = 32
+    
+    # 批量翻译选中条目时同时进行的翻译请求数
+    MAX_CONCURRENT_TRANSLATIONS = 8
+    
+    # 循环中报告进度的最小时间间隔(秒)，避免大量进度信号堆积在界面线程
+    PROGRESS_INTERVAL = 0.05
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.file_path = None
-        self.xml_tree = None
         self.language = None
         self.translated_name = None
         self.no_whitespace = None
         
-        # 翻译条目
-        self.translation_entries = []
+        # 根节点信息，保存时用于重建XML(解析时不保留整棵DOM树)
+        self._root_tag = None
+        self._root_attrib = {}
+        self._comments = []  # (在根节点中的位置, 注释文本)
+        
+        # 翻译条目按列存放：标签(同时作为ID)、原文、译文
+        self._types = []
+        self._originals = []
+        self._translations = []
+        self._entry_views = []  # 每个条目对应的Entry对象，供界面访问
+        
+        # 小写形式的ID、原文和译文列，筛选时无需每次重新转换大小写
+        self._id_lower = []
+        self._orig_lower = []
+        self._trans_lower = []
         
         # 条目类型列表（如entityname, entitydescription等）
         self.entry_types = set()
@@ -36,9 +193,10 @@ class XMLHandler(QObject):
         # 性能优化：添加索引和缓存
         self._id_to_entry_index = {}  # ID到条目索引的映射
         self._type_to_entries = {}    # 类型到条目列表的映射
-        self._search_cache = {}       # 搜索结果缓存
-        self._last_filter_result = None  # 上次筛选结果缓存
-        self._last_filter_params = None  # 上次筛选参数
+        self._filter_cache = OrderedDict()  # 筛选参数到条目索引列表的LRU缓存
+        self._last_progress_time = 0.0  # 上次在循环中报告进度的时间
+        self._search_segments = None  # 文本搜索用的各条目小写文本段(ID、原文、译文以\0分隔)
+        self._search_text = None  # 所有文本段拼接成的字符串及各条目的起始位置
     
     def load_file(self, file_path):
         """
@@ -60,30 +218,29 @@ class XMLHandler(QObject):
                 self.error_occurred.emit(f"文件不存在: {file_path}")
                 return False
             
-            # 读取文件内容并处理可能的BOM
+            if pygixml is not None:
+                self.progress_updated.emit(20, "正在解析XML结构...")
+                self._extract_with_pugixml(file_path)
+                self.progress_updated.emit(100, "文件加载完成")
+                return True
+            
+            # 流式读取文件并处理可能的BOM，解析时逐条提取条目并释放已处理的节点
             with open(file_path, 'rb') as f:
-                content = f.read()
-                
-                # 检测并移除UTF-8 BOM
-                if content.startswith(b'\xef\xbb\xbf'):
-                    content = content[3:]
+                # 检测并跳过UTF-8 BOM
+                if f.read(3) == b'\xef\xbb\xbf':
                     self.progress_updated.emit(10, "检测到UTF-8 BOM标记，已自动移除")
+                else:
+                    f.seek(0)
                 
-                # 解析XML
+                # 解析XML并提取所有翻译条目
                 self.progress_updated.emit(20, "正在解析XML结构...")
-                parser = etree.XMLParser(encoding='utf-8', remove_blank_text=True)
-                self.xml_tree = etree.fromstring(content, parser).getroottree()
-                root = self.xml_tree.getroot()
-            
-            # 读取根节点属性
-            self.progress_updated.emit(40, "提取文件属性...")
-            self.language = root.get('language', '')
-            self.translated_name = root.get('translatedname', '')
-            self.no_whitespace = root.get('nowhitespace', 'false').lower() == 'true'
-            
-            # 提取所有翻译条目
-            self.progress_updated.emit(60, "提取翻译条目...")
-            self.extract_translation_entries(root)
+                context = etree.iterparse(
+                    f,
+                    events=('start', 'end', 'comment'),
+                    encoding='utf-8',
+                    remove_blank_text=True
+                )
+                self.extract_translation_entries(context, f, os.path.getsize(file_path))
             
             self.progress_updated.emit(100, "文件加载完成")
             return True
@@ -94,108 +251,181 @@ class XMLHandler(QObject):
             traceback.print_exc()
             return False
     
-    def extract_translation_entries(self, root):
+    def _progress_due(self):
         """
-        从XML根节点提取所有翻译条目
+        判断循环中是否应该再次报告进度，距上次报告超过PROGRESS_INTERVAL时返回True并记录时间
+        
+        Returns:
+            bool: 是否报告进度
+        """
+        now = time.perf_counter()
+        if now - self._last_progress_time < self.PROGRESS_INTERVAL:
+            return False
+        self._last_progress_time = now
+        return True
+    
+    def extract_translation_entries(self, context, source=None, total_size=0):
+        """
+        从iterparse事件流中提取所有翻译条目
         
         Args:
-            root: XML根节点
+            context: etree.iterparse返回的(事件, 节点)迭代器，需包含start、end和comment事件
+            source: 正在解析的文件对象，用于根据读取位置报告进度
+            total_size: 文件总字节数
         """
-        self.translation_entries = []
-        self.entry_types = set()
-        self._id_to_entry_index = {}
-        self._type_to_entries = {}
-        self._search_cache = {}
-        self._last_filter_result = None
-        self._last_filter_params = None
-        
-        # 检查根节点是否为infotexts（潜渊症XML格式）
-        is_barotrauma = root.tag.lower() == 'infotexts'
-        
-        # 获取根节点属性
-        if is_barotrauma:
-            self.language = root.get('language', '')
-            self.translated_name = root.get('translatedname', '')
-            self.no_whitespace = root.get('nowhitespace', 'false').lower() == 'true'
-        
-        # 识别可能的特殊结构（如嵌套在Override标签内的条目）
-        elements_to_process = []
-        
-        # 查找所有需要处理的元素
-        for element in root:
-            # 跳过注释元素
-            if isinstance(element, etree._Comment):
-                continue
-                
-            # 检查是否是Override标签，这是一种特殊结构
-            if element.tag.lower() == 'override':
-                # 将Override内的所有子元素添加到处理列表
-                for child in element:
-                    if not isinstance(child, etree._Comment):
-                        elements_to_process.append(child)
-            else:
-                # 其他元素直接添加到处理列表
-                elements_to_process.append(element)
+        types = []
+        originals = []
+        comments = []
         
-        # 预先计算总元素数量，用于更精确的进度报告
-        total_elements = len(elements_to_process)
-        batch_size = max(1, min(100, total_elements // 100))  # 动态批处理大小
+        # 标签驻留为唯一字符串对象，重复标签共享同一对象，比较和字典查找更快
+        intern = sys.intern
         
-        # 遍历所有子元素
-        for i, element in enumerate(elements_to_process):
-            # 更新进度（从60%到90%之间）
-            if i % batch_size == 0:
-                progress = 60 + min(30, (i / max(1, total_elements)) * 30)
-                self.progress_updated.emit(int(progress), f"正在处理条目 {i+1}/{total_elements}...")
-            
-            tag = element.tag
-            self.entry_types.add(tag)
-            
-            # 获取文本内容
-            original_text = element.text or ""
-            
-            # 将条目添加到列表
-            entry = {
-                'type': tag,
-                'id': tag,  # 暂时使用tag作为ID
-                'original': original_text,
-                'translation': original_text  # 默认复制原文作为初始翻译
-            }
+        root = None
+        depth = 0
+        child_index = 0  # 当前处理到的根节点子元素位置
+        in_override = False
+        
+        for event, element in context:
+            if event == 'start':
+                depth += 1
+                if depth == 1:
+                    # 读取根节点属性
+                    root = element
+                    self._set_root(root.tag, dict(root.attrib))
+                elif depth == 2:
+                    # 检查是否是Override标签，这是一种特殊结构，其子元素同样是翻译条目
+                    in_override = element.tag.lower() == 'override'
+                continue
             
-            # 添加到主列表
-            self.translation_entries.append(entry)
+            if event == 'comment':
+                # 只保留根节点下的注释，保存时恢复到原位置
+                if depth == 1:
+                    comments.append((child_index, element.text))
+                    child_index += 1
+                continue
             
-            # 更新类型索引
-            if tag not in self._type_to_entries:
-                self._type_to_entries[tag] = []
-            self._type_to_entries[tag].append(len(self.translation_entries) - 1)
+            depth -= 1
+            if depth == 1 and not in_override or depth == 2 and in_override:
+                types.append(intern(element.tag))
+                originals.append(element.text or "")
+                
+                # 更新进度（从20%到90%之间）
+                if source is not None and len(types) % 1000 == 0 and self._progress_due():
+                    progress = 20 + min(70, (source.tell() / max(1, total_size)) * 70)
+                    self.progress_updated.emit(int(progress), f"正在处理条目 {len(types)}...")
+            
+            if depth == 1:
+                # 根节点的子元素处理完毕，释放它及之前的兄弟节点
+                child_index += 1
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del root[0]
         
-        # 后处理：标准化ID
-        self.normalize_entry_ids()
+        self._store_entries(types, originals, comments)
     
-    def normalize_entry_ids(self):
-        """规范化条目ID，提取实际的标识符并构建索引"""
-        # 清空ID索引
-        self._id_to_entry_index = {}
+    def _extract_with_pugixml(self, file_path):
+        """
+        使用pygixml(pugixml)解析XML文件并提取所有翻译条目
         
-        for i, entry in enumerate(self.translation_entries):
-            tag = entry['type']
-            text = entry['original']
-            
-            # 潜渊症XML文件中的标签通常是形如 entityname.xxx 的格式
-            # 直接使用标签作为ID，因为它已经是唯一标识符
-            entry_id = tag
-            entry['id'] = entry_id
-            
-            # 更新ID到索引的映射
-            self._id_to_entry_index[entry_id] = i
+        Args:
+            file_path: XML文件路径
+        """
+        # pugixml默认丢弃只含空白的文本节点，WS_PCDATA_SINGLE保留元素唯一的空白文本，
+        # 与lxml解析结果一致，且不会在元素之间产生额外的空白节点
+        flags = pygixml.ParseFlags.DEFAULT | pygixml.ParseFlags.COMMENTS | pygixml.ParseFlags.WS_PCDATA_SINGLE
+        document = pygixml.parse_file(file_path, flags)
+        root = document.root
+        
+        # 读取根节点属性
+        self.progress_updated.emit(40, "提取文件属性...")
+        attrib = {}
+        attribute = root.first_attribute()
+        while attribute is not None and attribute.name is not None:
+            attrib[attribute.name] = attribute.value
+            attribute = attribute.next_attribute
+        self._set_root(root.name, attrib)
+        
+        # 遍历根节点的子节点，Override标签内的子元素同样是翻译条目
+        self.progress_updated.emit(60, "提取翻译条目...")
+        types = []
+        originals = []
+        comments = []
+        child_index = 0
+        intern = sys.intern
+        
+        node = root.first_child()
+        while node is not None and not node.is_null():
+            node_type = node.type
+            if node_type == 'comment':
+                comments.append((child_index, node.value))
+                child_index += 1
+            elif node_type == 'element':
+                if node.name.lower() == 'override':
+                    for child in node.children():
+                        types.append(intern(child.name))
+                        originals.append(child.value or "")
+                else:
+                    types.append(intern(node.name))
+                    originals.append(node.value or "")
+                child_index += 1
+            node = node.next_sibling
+        
+        self._store_entries(types, originals, comments)
+    
+    def _set_root(self, tag, attrib):
+        """
+        记录根节点标签和属性，并读取文件属性
+        
+        Args:
+            tag: 根节点标签
+            attrib: 根节点属性字典
+        """
+        self._root_tag = tag
+        self._root_attrib = attrib
+        self.language = attrib.get('language', '')
+        self.translated_name = attrib.get('translatedname', '')
+        self.no_whitespace = attrib.get('nowhitespace', 'false').lower() == 'true'
+    
+    def _store_entries(self, types, originals, comments):
+        """
+        保存解析出的条目并重建索引
+        
+        Args:
+            types: 条目标签列表
+            originals: 条目原文列表
+            comments: 根节点下的注释列表，元素为(位置, 注释文本)
+        """
+        # 一次遍历同时构建类型索引和ID索引
+        type_to_entries = {}
+        id_to_entry_index = {}
+        for i, tag in enumerate(types):
+            # 更新类型索引
+            if tag not in type_to_entries:
+                type_to_entries[tag] = []
+            type_to_entries[tag].append(i)
             
-            # 对于特殊类型的标签，可以提取更有意义的ID
-            if '.' in tag:
-                # 例如 entityname.creature_endworm 这样的标签
-                # 可以考虑将 creature_endworm 部分提取为更具可读性的ID
-                # 但为了保持一致性，我们仍然使用完整的标签作为ID
-                pass
+            # 潜渊症XML文件中的标签通常是形如 entityname.xxx 的格式，
+            # 直接使用标签作为ID，因为它已经是唯一标识符（重复标签以最后一个为准）
+            id_to_entry_index[tag] = i
+        
+        self._types = types
+        self._originals = originals
+        self._translations = list(originals)  # 默认以原文作为初始翻译，与原文共享同一字符串对象
+        self._id_lower = [tag.lower() for tag in types]
+        self._orig_lower = [original.lower() for original in originals]
+        self._trans_lower = list(self._orig_lower)
+        self._search_segments = None
+        self._entry_views = [Entry(self, i) for i in range(len(types))]
+        self._type_to_entries = type_to_entries
+        self._id_to_entry_index = id_to_entry_index
+        self.entry_types = set(type_to_entries)
+        self._comments = comments
+        self._invalidate_caches()
+    
+    @property
+    def translation_entries(self):
+        """所有翻译条目，元素支持entry.original或entry['original']方式访问"""
+        return self._entry_views
     
     def export_to_excel(self, output_path):
         """
@@ -211,17 +441,15 @@ class XMLHandler(QObject):
             self.progress_updated.emit(0, "准备导出Excel...")
             
             # 计算总条目数
-            total_entries = len(self.translation_entries)
+            total_entries = len(self._types)
             batch_size = max(1, min(1000, total_entries // 20))  # 动态批处理大小
             
-            # 分批创建数据，减少内存占用
+            # 使用只写模式流式写入行数据，不在内存中保留单元格对象
             from openpyxl import Workbook
-            from openpyxl.utils.dataframe import dataframe_to_rows
             
             # 创建工作簿和工作表
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "翻译数据"
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("翻译数据")
             
             # 添加表头
             headers = ['类型', 'ID', '原文', '译文']
@@ -230,24 +458,19 @@ class XMLHandler(QObject):
             # 分批处理数据
             self.progress_updated.emit(10, "正在准备数据...")
             
-            for i, entry in enumerate(self.translation_entries):
-                # 添加一行数据
-                row = [
-                    entry['type'],
-                    entry['id'],
-                    entry['original'],
-                    entry['translation']
-                ]
-                ws.append(row)
+            for i, (tag, original, translation) in enumerate(zip(self._types, self._originals, self._translations)):
+                # 添加一行数据(ID即标签)
+                ws.append((tag, tag, original, translation))
                 
                 # 更新进度
-                if i % batch_size == 0:
+                if i % batch_size == 0 and self._progress_due():
                     progress = 10 + min(80, (i / max(1, total_entries)) * 80)
                     self.progress_updated.emit(int(progress), f"正在处理数据 {i+1}/{total_entries}...")
             
             # 保存Excel文件
             self.progress_updated.emit(90, "正在写入Excel文件...")
-            wb.save(output_path)
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                wb.save(f)
             
             self.progress_updated.emit(100, "Excel导出完成")
             return True
@@ -271,51 +494,13 @@ class XMLHandler(QObject):
         try:
             self.progress_updated.emit(0, "正在读取Excel文件...")
             
-            # 使用分块读取Excel，减少内存占用
-            # 首先读取头部以验证列
-            df_head = pd.read_excel(excel_path, engine='openpyxl', nrows=5)
-            
-            # 检查必要的列
-            required_columns = ['类型', 'ID', '原文', '译文']
-            for col in required_columns:
-                if col not in df_head.columns:
-                    self.error_occurred.emit(f"Excel文件缺少必要的列: {col}")
+            # 优先直接解析xlsx中的XML，遇到需要openpyxl转换的单元格时再使用openpyxl读取
+            translation_map = self._read_excel_translations_fast(excel_path)
+            if translation_map is None:
+                translation_map = self._read_excel_translations(excel_path)
+                if translation_map is None:
                     return False
             
-            # 创建ID到译文的映射
-            translation_map = {}
-            
-            # 分块读取Excel文件
-            chunk_size = 1000  # 每次读取1000行
-            reader = pd.read_excel(excel_path, engine='openpyxl', chunksize=chunk_size)
-            
-            total_rows = 0
-            processed_rows = 0
-            
-            # 首先计算总行数（可选，如果文件很大可以跳过）
-            try:
-                df_info = pd.read_excel(excel_path, engine='openpyxl', nrows=0)
-                with pd.ExcelFile(excel_path) as xls:
-                    total_rows = xls.book.worksheets[0].max_row - 1  # 减去标题行
-            except:
-                # 如果无法获取总行数，使用估计值
-                total_rows = 10000
-            
-            # 分块处理
-            for i, chunk in enumerate(reader):
-                # 更新进度
-                processed_rows += len(chunk)
-                progress = min(40, int((processed_rows / max(1, total_rows)) * 40))
-                self.progress_updated.emit(progress, f"正在读取Excel数据 {processed_rows}/{total_rows if total_rows > 0 else '未知'}...")
-                
-                # 处理当前块
-                for _, row in chunk.iterrows():
-                    entry_id = row['ID']
-                    translation = row['译文']
-                    
-                    if not pd.isna(translation) and translation.strip():
-                        translation_map[entry_id] = translation
-            
             # 使用ID索引更新翻译，避免全表扫描
             self.progress_updated.emit(50, "正在更新翻译...")
             count = 0
@@ -326,19 +511,16 @@ class XMLHandler(QObject):
             for i, (entry_id, translation) in enumerate(translation_map.items()):
                 # 使用ID索引快速查找条目
                 if entry_id in self._id_to_entry_index:
-                    idx = self._id_to_entry_index[entry_id]
-                    self.translation_entries[idx]['translation'] = translation
+                    self._set_translation(self._id_to_entry_index[entry_id], translation)
                     count += 1
                 
                 # 更新进度
-                if i % batch_size == 0:
+                if i % batch_size == 0 and self._progress_due():
                     progress = 50 + min(50, (i / max(1, total_entries)) * 50)
                     self.progress_updated.emit(int(progress), f"正在更新翻译 {i+1}/{total_entries}...")
             
             # 清除缓存，因为翻译内容已更改
-            self._search_cache = {}
-            self._last_filter_result = None
-            self._last_filter_params = None
+            self._invalidate_caches()
             
             self.progress_updated.emit(100, f"已导入 {count} 条翻译")
             return True
@@ -349,6 +531,174 @@ class XMLHandler(QObject):
             traceback.print_exc()
             return False
     
+    def _read_excel_translations(self, excel_path):
+        """
+        使用openpyxl只读模式逐行读取Excel中的译文
+        
+        Args:
+            excel_path: Excel文件路径
+            
+        Returns:
+            dict: ID到译文的映射，缺少必要的列时返回None
+        """
+        from openpyxl import load_workbook
+        wb = load_workbook(excel_path, read_only=True, data_only=True)
+        try:
+            ws = wb.active
+            rows = ws.iter_rows(values_only=True)
+            headers = list(next(rows, ()))
+            
+            # 检查必要的列
+            required_columns = ['类型', 'ID', '原文', '译文']
+            for col in required_columns:
+                if col not in headers:
+                    self.error_occurred.emit(f"Excel文件缺少必要的列: {col}")
+                    return None
+            
+            id_idx = headers.index('ID')
+            trans_idx = headers.index('译文')
+            
+            # 工作表维度直接给出总行数，无需额外读取一遍
+            total_rows = max(0, (ws.max_row or 1) - 1)  # 减去标题行
+            
+            # 创建ID到译文的映射
+            translation_map = {}
+            processed_rows = 0
+            min_width = max(id_idx, trans_idx) + 1
+            
+            # 每次取1000行原始元组，用字典推导批量构建映射，不逐行做属性访问
+            chunk_size = 1000
+            for chunk in iter(lambda: list(itertools.islice(rows, chunk_size)), []):
+                pairs = ((row[id_idx], str(row[trans_idx])) for row in chunk
+                         if len(row) >= min_width and row[trans_idx] is not None)
+                translation_map.update({entry_id: translation for entry_id, translation in pairs
+                                        if translation.strip()})
+                
+                processed_rows += len(chunk)
+                if self._progress_due():
+                    progress = min(40, int((processed_rows / max(1, total_rows)) * 40))
+                    self.progress_updated.emit(progress, f"正在读取Excel数据 {processed_rows}/{total_rows}...")
+        finally:
+            # 只读模式会保持文件句柄，读取完毕立即关闭
+            wb.close()
+        
+        return translation_map
+    
+    def _read_excel_translations_fast(self, excel_path):
+        """
+        直接解析xlsx压缩包中的共享字符串表和工作表XML读取译文，
+        不为每个单元格创建openpyxl的单元格对象
+        
+        只处理ID列和译文列都是文本单元格的工作簿，数字、日期等需要openpyxl转换的单元格
+        以及无法识别的文件结构都返回None，由openpyxl读取
+        
+        Args:
+            excel_path: Excel文件路径
+            
+        Returns:
+            dict: ID到译文的映射，无法快速读取时返回None
+        """
+        main = _XLSX_MAIN_NS
+        try:
+            with zipfile.ZipFile(excel_path) as archive:
+                # 通过工作簿关系找到当前活动工作表和共享字符串表
+                workbook = etree.fromstring(archive.read('xl/workbook.xml'))
+                relations = etree.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+                targets = {
+                    rel.get('Id'): (rel.get('Type', ''), rel.get('Target', ''))
+                    for rel in relations.iter(_XLSX_PKG_REL_NS + 'Relationship')
+                }
+                
+                view = workbook.find(f'{main}bookViews/{main}workbookView')
+                active = int(view.get('activeTab', 0)) if view is not None else 0
+                sheet = workbook.find(main + 'sheets')[active]
+                sheet_type, sheet_target = targets[sheet.get(_XLSX_REL_NS + 'id')]
+                if not sheet_type.endswith('/worksheet'):
+                    return None
+                
+                def part_path(target):
+                    return target[1:] if target.startswith('/') else 'xl/' + target
+                
+                # 读取共享字符串表
+                strings = []
+                for rel_type, target in targets.values():
+                    if rel_type.endswith('/sharedStrings'):
+                        with archive.open(part_path(target)) as source:
+                            for _, item in etree.iterparse(source, tag=main + 'si'):
+                                strings.append(_xlsx_text(item).replace('x005F_', ''))
+                                item.clear()
+                                while item.getprevious() is not None:
+                                    del item.getparent()[0]
+                        break
+                
+                def cell_value(cell):
+                    cell_type = cell.get('t', 'n')
+                    if cell_type == 'inlineStr':
+                        inline = cell.find(main + 'is')
+                        return _xlsx_text(inline) if inline is not None else None
+                    value = cell.findtext(main + 'v') or None
+                    if value is None:
+                        return None
+                    if cell_type == 's':
+                        return strings[int(value)]
+                    if cell_type == 'str':
+                        return value
+                    # 数字、布尔值、日期等交给openpyxl转换
+                    raise ValueError(cell_type)
+                
+                translation_map = {}
+                columns = None  # 需要读取的列字母: (ID列, 译文列)
+                total_rows = 0
+                processed_rows = 0
+                
+                with archive.open(part_path(sheet_target)) as source:
+                    for _, element in etree.iterparse(source, tag=(main + 'dimension', main + 'row')):
+                        if element.tag == main + 'dimension':
+                            # 工作表维度给出总行数，用于报告进度
+                            last_cell = element.get('ref', '').split(':')[-1]
+                            total_rows = max(0, int(last_cell.lstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ') or 1) - 1)
+                            continue
+                        
+                        row_number = element.get('r')
+                        values = {}
+                        for cell in element.iterchildren(main + 'c'):
+                            column = cell.get('r').rstrip('0123456789')
+                            if columns is None or column in columns:
+                                values[column] = cell_value(cell)
+                        
+                        # 释放已处理的行
+                        element.clear()
+                        while element.getprevious() is not None:
+                            del element.getparent()[0]
+                        
+                        if columns is None:
+                            # 第一行必须是标题行，且包含所有必要的列
+                            if row_number != '1':
+                                return None
+                            headers = {}
+                            for column, header in values.items():
+                                headers.setdefault(header, column)
+                            if any(col not in headers for col in ('类型', 'ID', '原文', '译文')):
+                                return None
+                            columns = (headers['ID'], headers['译文'])
+                            continue
+                        
+                        translation = values.get(columns[1])
+                        if translation is not None and translation.strip():
+                            translation_map[values.get(columns[0])] = translation
+                        
+                        processed_rows += 1
+                        if processed_rows % 1000 == 0 and self._progress_due():
+                            progress = min(40, int((processed_rows / max(1, total_rows)) * 40))
+                            self.progress_updated.emit(progress, f"正在读取Excel数据 {processed_rows}/{total_rows}...")
+                
+                if columns is None:
+                    return None
+                return translation_map
+        except (KeyError, IndexError, ValueError, TypeError, AttributeError,
+                zipfile.BadZipFile, etree.XMLSyntaxError):
+            return None
+    
     def save_xml(self, output_path=None):
         """
         保存更新后的XML文件
@@ -362,76 +712,91 @@ class XMLHandler(QObject):
         if output_path is None:
             output_path = self.file_path
         
-        if not self.xml_tree:
+        if self._root_tag is None:
             self.error_occurred.emit("没有加载XML文件")
             return False
         
         try:
             self.progress_updated.emit(0, "准备保存XML...")
             
-            # 获取根节点
-            root = self.xml_tree.getroot()
-            
             # 检查是否为潜渊症XML格式
-            is_barotrauma = root.tag.lower() == 'infotexts'
+            is_barotrauma = self._root_tag.lower() == 'infotexts'
             
             # 保存根节点属性但强制设置为简体中文
-            root_attribs = dict(root.attrib)
+            root_attribs = dict(self._root_attrib)
             if is_barotrauma:
                 root_attribs['language'] = 'Simplified Chinese'
                 root_attribs['translatedname'] = '中文（简体）'
             
-            # 创建新的根节点，使用修改后的属性
-            new_root = etree.Element(root.tag, attrib=root_attribs)
-            
-            # 提取注释
-            comments = []
-            for child in root:
-                if isinstance(child, etree._Comment):
-                    comments.append((root.index(child), child))
-            
             # 计算总条目数
-            total_entries = len(self.translation_entries)
+            total_entries = len(self._types)
             batch_size = max(1, min(100, total_entries // 100))  # 动态批处理大小
+            pretty_print = not self.no_whitespace
             
-            # 更新翻译
-            self.progress_updated.emit(30, "更新翻译内容...")
-            
-            # 分批处理，减少内存占用
-            for i, entry in enumerate(self.translation_entries):
-                # 创建新元素
-                element = etree.SubElement(new_root, entry['type'])
-                element.text = entry['translation']
-                
-                # 更新进度
-                if i % batch_size == 0:
-                    progress = 30 + min(60, (i / max(1, total_entries)) * 60)
-                    self.progress_updated.emit(int(progress), f"正在更新条目 {i+1}/{total_entries}...")
-            
-            # 恢复注释
-            for pos, comment in comments:
-                # 确保位置在有效范围内
-                if pos < len(new_root):
-                    new_root.insert(pos, comment)
-                else:
-                    new_root.append(comment)
+            # 注释按位置与条目合并写出，位置超出条目数的注释放在末尾
+            pending_comments = self._comments
+            comments = []  # 写出后注释在根节点中的实际位置
             
-            # 创建新的XML树
-            new_tree = etree.ElementTree(new_root)
+            self.progress_updated.emit(30, "正在写入文件...")
             
-            # 写入文件
-            self.progress_updated.emit(90, "正在写入文件...")
-            
-            # 使用增量写入，减少内存占用
-            new_tree.write(
-                output_path, 
-                encoding='utf-8', 
-                xml_declaration=True, 
-                pretty_print=not self.no_whitespace
-            )
+            # 使用xmlfile逐个元素流式写入，不在内存中构建第二棵树
+            with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                with etree.xmlfile(f, encoding='UTF-8') as xf:
+                    xf.write_declaration()
+                    
+                    # 格式化输出时每个子节点单独一行并缩进两个空格，最后一个子节点后只换行
+                    total_children = total_entries + len(pending_comments)
+                    indent = '\n  ' if pretty_print else ''
+                    
+                    def write_separator(child_index):
+                        if pretty_print:
+                            xf.write(indent if child_index < total_children - 1 else '\n')
+                    
+                    if not total_children:
+                        # 没有子节点时与序列化整棵树一致，输出自闭合的根节点
+                        xf.write(etree.Element(self._root_tag, attrib=root_attribs))
+                    else:
+                        with xf.element(self._root_tag, attrib=root_attribs):
+                            if pretty_print:
+                                xf.write(indent)
+                            
+                            child_index = 0
+                            comment_index = 0
+                            for i, (tag, translation) in enumerate(zip(self._types, self._translations)):
+                                # 先写出应位于当前位置的注释
+                                while comment_index < len(pending_comments) and pending_comments[comment_index][0] <= child_index:
+                                    text = pending_comments[comment_index][1]
+                                    xf.write(etree.Comment(text))
+                                    write_separator(child_index)
+                                    comments.append((child_index, text))
+                                    child_index += 1
+                                    comment_index += 1
+                                
+                                # 直接写出开始标签、文本和结束标签，无需为每个条目创建元素对象
+                                with xf.element(tag):
+                                    xf.write(translation)
+                                write_separator(child_index)
+                                child_index += 1
+                                
+                                # 更新进度
+                                if i % batch_size == 0 and self._progress_due():
+                                    progress = 30 + min(65, (i / max(1, total_entries)) * 65)
+                                    self.progress_updated.emit(int(progress), f"正在写入条目 {i+1}/{total_entries}...")
+                            
+                            # 剩余的注释追加到末尾
+                            for _, text in pending_comments[comment_index:]:
+                                xf.write(etree.Comment(text))
+                                write_separator(child_index)
+                                comments.append((child_index, text))
+                                child_index += 1
+                
+                # 格式化输出时文件以换行结尾
+                if pretty_print:
+                    f.write(b'\n')
             
-            # 更新内部XML树
-            self.xml_tree = new_tree
+            # 更新根节点信息，与写入的文件保持一致
+            self._root_attrib = root_attribs
+            self._comments = comments
             
             self.progress_updated.emit(100, "XML保存完成")
             return True
@@ -453,35 +818,35 @@ class XMLHandler(QObject):
         Returns:
             int: 成功翻译的条目数量
         """
-        if not self.translation_entries:
+        if not self._types:
             self.error_occurred.emit("没有加载翻译条目")
             return 0
         
         count = 0
-        total = len(indices)
         
+        # 跳过无效索引和空文本
+        originals = self._originals
+        targets = [idx for idx in indices
+                   if 0 <= idx < len(originals) and originals[idx] and originals[idx].strip()]
+        total = len(targets)
+        
+        # 翻译函数通常是网络请求，多个请求并发进行，按完成顺序写回译文
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.MAX_CONCURRENT_TRANSLATIONS, total)))
         try:
-            for i, idx in enumerate(indices):
-                if idx < 0 or idx >= len(self.translation_entries):
-                    continue
-                
-                entry = self.translation_entries[idx]
-                original_text = entry['original']
-                
-                # 避免空文本
-                if not original_text or not original_text.strip():
-                    continue
-                
-                # 更新进度
-                progress = int((i / max(1, total)) * 100)
-                self.progress_updated.emit(progress, f"正在翻译 {i+1}/{total}...")
-                
-                # 调用翻译函数
-                translation = translator_func(original_text)
+            futures = {executor.submit(translator_func, originals[idx]): idx for idx in targets}
+            
+            for i, future in enumerate(as_completed(futures)):
+                idx = futures[future]
+                translation = future.result()
                 
                 if translation and translation.strip():
-                    entry['translation'] = translation
+                    self._set_translation(idx, translation)
                     count += 1
+                
+                # 更新进度
+                if self._progress_due():
+                    progress = int(((i + 1) / max(1, total)) * 100)
+                    self.progress_updated.emit(progress, f"正在翻译 {i+1}/{total}...")
             
             self.progress_updated.emit(100, f"已翻译 {count} 条内容")
             return count
@@ -491,6 +856,11 @@ class XMLHandler(QObject):
             import traceback
             traceback.print_exc()
             return count
+        finally:
+            # 出错时取消尚未开始的请求
+            executor.shutdown(wait=False, cancel_futures=True)
+            if count:
+                self._invalidate_caches()
     
     def get_translation_entries(self):
         """获取所有翻译条目"""
@@ -502,26 +872,9 @@ class XMLHandler(QObject):
     
     def get_item_tags(self):
         """获取所有物品标签"""
-        tags = set()
-        for entry in self.translation_entries:
-            parts = entry['id'].split('.')
-            if len(parts) > 1:
-                item_part = parts[1]
-                for prefix in ['weapon_', 'tool_', 'medical_', 'suit_', 'item_', 'creature_', 'material_']:
-                    if item_part.startswith(prefix):
-                        tags.add(prefix[:-1])
-                        break
-                
-                if 'gun' in item_part or 'rifle' in item_part or 'pistol' in item_part:
-                    tags.add('weapon')
-                elif 'medic' in item_part or 'health' in item_part or 'bandage' in item_part:
-                    tags.add('medical')
-                elif 'armor' in item_part or 'helmet' in item_part:
-                    tags.add('suit')
-                elif 'monster' in item_part or 'alien' in item_part:
-                    tags.add('creature')
-        
-        return sorted(list(tags))
+        # 所有ID以换行拼接后，每个标签只需一次正则扫描，找到第一个匹配即停止
+        ids = '\n'.join(self._types)
+        return sorted(tag for tag, pattern in _ITEM_TAG_PATTERNS if pattern.search(ids))
     
     def update_translation(self, entry_id, translation):
         """
@@ -537,16 +890,98 @@ class XMLHandler(QObject):
         # 使用ID索引快速查找条目
         if entry_id in self._id_to_entry_index:
             idx = self._id_to_entry_index[entry_id]
-            self.translation_entries[idx]['translation'] = translation
+            if self._translations[idx] == translation:
+                # 译文未变化，无需更新索引和清除缓存
+                return True
+            
+            self._set_translation(idx, translation)
             
             # 清除可能受影响的缓存
-            self._search_cache = {}
-            self._last_filter_result = None
-            self._last_filter_params = None
+            self._invalidate_caches()
             
             return True
         return False
     
+    def _set_translation(self, idx, translation):
+        """
+        设置单个条目的译文，同时更新小写列和该条目的搜索文本段
+        
+        调用方在修改完成后负责调用_invalidate_caches
+        
+        Args:
+            idx: 条目索引
+            translation: 新的翻译文本
+        """
+        self._translations[idx] = translation
+        translation_lower = translation.lower()
+        self._trans_lower[idx] = translation_lower
+        if self._search_segments is not None:
+            self._search_segments[idx] = f"{self._id_lower[idx]}\0{self._orig_lower[idx]}\0{translation_lower}\0"
+    
+    def _invalidate_caches(self):
+        """翻译内容变化后清除筛选缓存和拼接的搜索文本，各条目的文本段已在修改时单独更新"""
+        self._filter_cache.clear()
+        self._search_text = None
+    
+    def _get_search_segments(self):
+        """
+        获取各条目的小写搜索文本段，首次搜索时由小写列生成
+        
+        Returns:
+            list: 每个条目的ID、原文和译文小写后以\0分隔组成的文本段
+        """
+        if self._search_segments is None:
+            self._search_segments = [f"{entry_id}\0{original}\0{translation}\0"
+                                     for entry_id, original, translation
+                                     in zip(self._id_lower, self._orig_lower, self._trans_lower)]
+        return self._search_segments
+    
+    def _get_search_text(self):
+        """
+        获取所有文本段拼接成的字符串，翻译内容变化后按需重新拼接
+        
+        Returns:
+            tuple: (拼接后的字符串, 各条目在其中的起始位置)
+        """
+        if self._search_text is None:
+            segments = self._get_search_segments()
+            starts = [0]
+            starts.extend(itertools.accumulate(map(len, segments)))
+            starts.pop()
+            self._search_text = (''.join(segments), starts)
+        return self._search_text
+    
+    def _search_all(self, search_text_lower):
+        """
+        在所有条目的ID、原文和译文中查找(已转为小写的)搜索文本
+        
+        用str.find在拼接后的整块文本上扫描，命中后通过二分查找定位所属条目并跳到下一个条目继续，
+        未命中的条目不产生Python层面的开销；命中率较高时改为逐条判断剩余条目
+        
+        Args:
+            search_text_lower: 小写的搜索文本，不能包含\0
+            
+        Returns:
+            list: 按顺序排列的命中条目索引
+        """
+        segments = self._get_search_segments()
+        text, starts = self._get_search_text()
+        find = text.find
+        count = len(starts)
+        result = []
+        pos = find(search_text_lower)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            result.append(i)
+            if i + 1 == count:
+                break
+            if len(result) > 64 and len(result) * 4 > i:
+                # 超过四分之一的条目命中，逐条判断比逐个定位命中位置更快
+                result.extend(j for j in range(i + 1, count) if search_text_lower in segments[j])
+                break
+            pos = find(search_text_lower, starts[i + 1])
+        return result
+    
     def filter_entries(self, entry_type=None, search_text=None, translated_only=False, item_category=None, untranslated_only=False):
         """
         根据条件筛选条目
@@ -561,93 +996,75 @@ class XMLHandler(QObject):
         Returns:
             list: 符合条件的条目列表
         """
-        # 清除之前的缓存，确保每次筛选都能获取最新结果
-        self._search_cache = {}
-        self._last_filter_result = None
-        self._last_filter_params = None
-        
         # 创建筛选参数的唯一标识
         filter_params = (entry_type, search_text, translated_only, item_category, untranslated_only)
         
-        # 准备起始条目集合
-        if entry_type and entry_type in self._type_to_entries:
-            # 如果按类型筛选，使用类型索引
-            base_entries = [self.translation_entries[idx] for idx in self._type_to_entries[entry_type]]
+        # 命中缓存时直接按索引返回条目，缓存在翻译内容变化时清空
+        cached = self._filter_cache.get(filter_params)
+        if cached is not None:
+            self._filter_cache.move_to_end(filter_params)
+            entry_views = self._entry_views
+            return [entry_views[i] for i in cached]
+        
+        # 准备起始条目集合：按类型筛选时直接从类型索引开始，只遍历该类型的条目
+        if entry_type:
+            base_indices = self._type_to_entries.get(entry_type, [])
         else:
             # 否则使用所有条目
-            base_entries = self.translation_entries
+            base_indices = range(len(self._types))
         
-        result = []
+        originals = self._originals
+        translations = self._translations
         
-        # 物品类别关键词映射 - 使用英文键名匹配UI中的标签
-        category_keywords = {
-            "weapon": ["weapon", "gun", "rifle", "pistol", "shotgun", "smg", "revolver", "coilgun", "railgun", "explosive", "grenade", "launcher", "machinegun", "carbine", "assault", "sniper"],
-            "tool": ["tool", "cutter", "welder", "screwdriver", "wrench", "crowbar", "repair", "extinguisher", "knife", "axe", "mace", "sword"],
-            "medical": ["medical", "medic", "bandage", "health", "firstaid", "antidote", "medicine", "cure", "stim", "heal", "affliction"],
-            "suit": ["suit", "diving", "armor", "uniform", "clothes", "helmet", "gear", "outfit", "exoskeleton", "ballistichelmet", "bodyarmor", "tactical"],
-            "item": ["round", "ammo", "magazine", "shell", "bullet", "clip", "explosive", "dart", "rocket", "grenade", "cartridge"],
-            "material": ["material", "resource", "steel", "plastic", "rubber", "fabric", "organic", "alien", "barrel", "reciever", "gunpowder"],
-            "creature": ["creature", "monster", "animal", "alien", "moloch", "endworm", "crawler", "husk", "affliction"]
-        }
-        
-        # 应用所有筛选条件
-        for entry in base_entries:
-            # 按类型筛选
-            if entry_type and entry['type'] != entry_type and not (entry_type in self._type_to_entries):
-                continue
-            
-            # 按物品类别筛选
-            if item_category:
-                entry_id_lower = entry['id'].lower()
-                entry_text_lower = entry['original'].lower()
-                
-                # 检查是否匹配选定的物品类别
-                matched = False
-                
-                # 直接使用英文类别名称查找关键词列表
-                if item_category in category_keywords:
-                    keywords = category_keywords[item_category]
-                    if any(keyword in entry_id_lower or keyword in entry_text_lower for keyword in keywords):
-                        matched = True
-                
-                if not matched:
-                    continue
-            
-            # 按文本搜索(不区分大小写)
-            if search_text:
-                search_text_lower = search_text.lower()
-                if (search_text_lower not in entry['id'].lower() and 
-                    search_text_lower not in entry['original'].lower() and 
-                    search_text_lower not in entry['translation'].lower()):
-                    continue
-            
-            # 按翻译状态筛选 - 改进判断逻辑
-            if translated_only:
-                # 检查是否已翻译（译文与原文不同且非空）
-                is_translated = (entry['translation'] != entry['original']) and entry['translation'].strip()
-                # 检查是否是已标记的条目（以"[已标记]"开头）
-                is_marked = entry['translation'].strip().startswith("[已标记]")
-                
-                if not (is_translated or is_marked):
-                    continue
-            
-            # 按未翻译状态筛选
-            if untranslated_only:
-                # 检查是否未翻译（译文为空或与原文相同）
-                is_untranslated = not entry['translation'].strip() or entry['translation'] == entry['original']
-                # 确保不是已标记的条目
-                is_not_marked = not entry['translation'].strip().startswith("[已标记]")
-                
-                if not (is_untranslated and is_not_marked):
-                    continue
-            
-            result.append(entry)
+        # 按列逐个条件筛选：每个条件对候选索引做一次整列扫描，未启用的条件不会在每个条目上重复判断。
+        # 类型已通过索引缩小范围；文本搜索在候选为全部条目时可直接扫描整块文本，因此最先进行；
+        # 然后是开销很小的翻译状态判断，最后对剩余条目执行开销最大的类别正则匹配
+        indices = base_indices
         
-        # 更新筛选结果缓存
-        self._last_filter_params = filter_params
-        self._last_filter_result = result
+        # 按文本搜索(不区分大小写)
+        if search_text:
+            search_text_lower = search_text.lower()
+            if '\0' in search_text_lower:
+                # 条目文本中不会出现\0，也就不可能匹配
+                indices = []
+            elif isinstance(indices, range):
+                # 候选为全部条目时在整块文本上扫描
+                indices = self._search_all(search_text_lower)
+            else:
+                segments = self._get_search_segments()
+                indices = [i for i in indices if search_text_lower in segments[i]]
         
-        return result
+        # 按翻译状态筛选 - 已翻译（译文与原文不同且非空）或是已标记的条目（以"[已标记]"开头）
+        if translated_only:
+            indices = [i for i in indices
+                       if (translations[i] != originals[i] and translations[i].strip())
+                       or translations[i].strip().startswith("[已标记]")]
+        
+        # 按未翻译状态筛选 - 译文为空或与原文相同，且不是已标记的条目
+        if untranslated_only:
+            indices = [i for i in indices
+                       if (not translations[i].strip() or translations[i] == originals[i])
+                       and not translations[i].strip().startswith("[已标记]")]
+        
+        # 按物品类别筛选
+        if item_category:
+            # 直接使用英文类别名称查找预编译的关键词正则
+            pattern = _CATEGORY_PATTERNS.get(item_category)
+            if pattern is not None:
+                search = pattern.search
+                id_lower = self._id_lower
+                orig_lower = self._orig_lower
+                indices = [i for i in indices if search(id_lower[i]) or search(orig_lower[i])]
+            else:
+                indices = []
+        
+        # 更新筛选结果缓存，只保存索引以控制内存
+        self._filter_cache[filter_params] = list(indices)
+        if len(self._filter_cache) > self.FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
+        
+        entry_views = self._entry_views
+        return [entry_views[i] for i in indices]
 
 # 测试代码
 if __name__ == "__main__":
@@ -676,4 +1093,19 @@ if __name__ == "__main__":
     else:
         print(f"测试文件不存在: {test_file}")
     
+    # 回归检查：只含空白的条目在pugixml和lxml两种解析路径下都应原样保留
+    import tempfile
+    with tempfile.TemporaryDirectory() as temp_dir:
+        whitespace_file = os.path.join(temp_dir, "whitespace.xml")
+        with open(whitespace_file, 'w', encoding='utf-8') as f:
+            f.write('<?xml version="1.0" encoding="utf-8"?>\n<infotexts>\n  <a.x>   </a.x>\n  <b.y>text</b.y>\n</infotexts>\n')
+        
+        for parser in ([pygixml, None] if pygixml is not None else [None]):
+            pygixml = parser
+            whitespace_handler = XMLHandler()
+            whitespace_handler.load_file(whitespace_file)
+            originals = [entry['original'] for entry in whitespace_handler.get_translation_entries()]
+            assert originals == ['   ', 'text'], f"空白条目解析不一致: {originals}"
+        print("空白条目回归检查通过")
+    
     sys.exit(0)
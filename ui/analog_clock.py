@@ -10,15 +10,29 @@ import math
 import random
 import time
 from PyQt6.QtWidgets import QWidget, QApplication
-from PyQt6.QtCore import Qt, QTimer, QSize, QRectF, QPointF, QDateTime
+from PyQt6.QtCore import Qt, QTimer, QSize, QRectF, QPointF, QPoint, QLine, QDateTime
 from PyQt6.QtGui import (
     QPainter, QColor, QFont, QPen, QRadialGradient, 
-    QLinearGradient, QPainterPath, QPolygonF, QBrush
+    QLinearGradient, QPainterPath, QPolygonF, QBrush, QPixmap, QImage
 )
 
 class AnalogClock(QWidget):
     """科幻风格的模拟表盘时钟"""
     
+    # 固定角度的三角函数表：60个刻度（从12点方向顺时针）、30根外环辐条、6条内环径向线
+    _TICK_COS = tuple(math.cos(math.radians(i * 6) - math.pi/2) for i in range(60))
+    _TICK_SIN = tuple(math.sin(math.radians(i * 6) - math.pi/2) for i in range(60))
+    _SPOKE_DIRS = tuple((math.cos(math.radians(i * 12)), math.sin(math.radians(i * 12)))
+                        for i in range(30))
+    _RADIAL_DIRS = tuple((math.cos(math.radians(i * 60)), math.sin(math.radians(i * 60)))
+                         for i in range(6))
+    
+    # 脉冲值按帧往返于0到1之间（每帧步长0.25）
+    _PULSE_LUT = (0.25, 0.5, 0.75, 1.0, 0.75, 0.5, 0.25, 0.0)
+    # 数据点闪烁透明度表：按闪烁状态[0, 1)分1024级，透明度已量化为16级步进
+    _BLINK_ALPHA_LUT = tuple(int(100 + 150 * math.sin(i / 1024 * math.pi)) & ~0xF
+                             for i in range(1024))
+    
     def __init__(self, parent=None):
         """初始化表盘时钟"""
         super().__init__(parent)
@@ -33,83 +47,194 @@ class AnalogClock(QWidget):
         self.inner_ring_angle = 0
         self.scan_line_angle = 0
         
-        self.data_points = []
         self.generate_data_points(20)
         
         self.pulse_value = 0
-        self.pulse_direction = 1
+        self._frame = 0
         
-        self.markers = []
         self.generate_markers(6)
         
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_animation)
-        self.update_timer.start(50)
+        # 外环辐条长度与亮度随装饰动画随机刷新以保留闪烁效果
+        self.generate_spokes()
+        
+        # 每帧使用的画笔和画刷预先创建，避免重复构造
+        self._ensure_palette()
+        
+        # 表盘刻度与数字位置只取决于控件尺寸，缓存后按尺寸失效
+        self._face_cache = None
+        # 装饰文字的字体与宽度同样按尺寸缓存
+        self._text_cache = None
+        # 静态表盘预先绘制到位图，每帧只需贴图一次
+        self._face_pixmap = None
+        # 指针与装饰层只在慢速定时器更新时重绘，扫描线刷新时直接贴图
+        self._overlay = None
+        self._overlay_dirty = True
+        
+        # 扫描线上次重绘的区域，用于擦除旧位置
+        self._scan_rect = None
+        
+        # 快速定时器只刷新扫描线所在区域，慢速定时器更新指针与装饰并整体重绘
+        self._anim_timer = QTimer(self)
+        self._anim_timer.timeout.connect(self.update_scan_line)
+        self._hand_timer = QTimer(self)
+        self._hand_timer.timeout.connect(self.update_animation)
+        self.start_clock()
     
     def start_clock(self):
         """启动时钟"""
-        if not self.update_timer.isActive():
-            self.update_timer.start(50)
+        if not self._anim_timer.isActive():
+            self._anim_timer.start(50)
+        if not self._hand_timer.isActive():
+            self._hand_timer.start(250)
     
     def stop_clock(self):
         """停止时钟"""
-        if self.update_timer.isActive():
-            self.update_timer.stop()
+        if self._anim_timer.isActive():
+            self._anim_timer.stop()
+        if self._hand_timer.isActive():
+            self._hand_timer.stop()
+    
+    def _ensure_palette(self):
+        """创建每帧绘制所需的画笔、画刷缓存"""
+        if getattr(self, '_pens', None):
+            return
+        
+        hour_color = QColor(0, 200, 0, 220)
+        minute_color = QColor(0, 255, 0, 220)
+        second_color = QColor(0, 255, 0, 180)
+        glow_color = QColor(50, 255, 100, 150)
+        
+        self._pens = {
+            'hour_hand': QPen(hour_color, 1),
+            'minute_hand': QPen(minute_color, 1),
+            'second_hand': QPen(second_color, 1),
+            'hub': QPen(QColor(0, 255, 0), 1),
+            'outer_ring': QPen(QColor(0, 150, 0, 80), 1, Qt.PenStyle.DotLine),
+            'inner_ring': QPen(QColor(0, 120, 0, 100), 1, Qt.PenStyle.DashLine),
+            'radial': QPen(QColor(0, 150, 0, 120), 1),
+            'scan_line': QPen(QColor(0, 255, 0, 100), 2),
+            'glow': QPen(glow_color, 1),
+            'marker_active': QPen(QColor(0, 255, 0, 220), 1),
+            'marker_inactive': QPen(QColor(0, 100, 0, 150), 1),
+            'date': QPen(QColor(0, 200, 0)),
+            'status': QPen(QColor(0, 255, 0)),
+        }
+        self._brushes = {
+            'hour_hand': QBrush(hour_color),
+            'minute_hand': QBrush(minute_color),
+            'second_hand': QBrush(second_color),
+            'hub': QBrush(QColor(0, 200, 0)),
+            'glow': QBrush(glow_color),
+        }
+        # 外环辐条按亮度取画笔（亮度为20级步进）
+        self._spoke_pens = {intensity: QPen(QColor(0, intensity, 0, 130), 1)
+                            for intensity in range(100, 201, 20)}
+        # 脉冲环透明度只有几种取值，预先创建对应画笔
+        self._pulse_pens = {}
+        for pulse in self._PULSE_LUT:
+            alpha = int(40 + 30 * pulse)
+            self._pulse_pens[alpha] = QPen(QColor(0, 200, 0, alpha), 1)
+        # 数据点的透明度随动画变化，按需创建后缓存
+        self._dp_styles = {}
     
     def generate_data_points(self, count):
-        """生成随机数据点"""
-        self.data_points = []
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0.65, 0.9)
-            intensity = random.randint(150, 255)
-            
-            self.data_points.append({
-                'angle': angle,
-                'distance': distance,
-                'intensity': intensity,
-                'size': random.uniform(1.5, 3.5),
-                'blink_rate': random.uniform(0.02, 0.1),
-                'blink_state': random.random()
-            })
+        """生成随机数据点
+        
+        数据点按属性分列保存，每帧更新闪烁状态时只需遍历两列
+        """
+        angles = [random.uniform(0, 2 * math.pi) for _ in range(count)]
+        distances = [random.uniform(0.65, 0.9) for _ in range(count)]
+        
+        # 角度与距离固定，预先计算相对半径的偏移
+        self._dp_dx = [d * math.cos(a) for a, d in zip(angles, distances)]
+        self._dp_dy = [d * math.sin(a) for a, d in zip(angles, distances)]
+        # 亮度取15级步进，相同样式的数据点可以共用一次画笔设置
+        self._dp_intensity = [random.randrange(150, 256, 15) for _ in range(count)]
+        self._dp_size = [random.uniform(1.5, 3.5) for _ in range(count)]
+        self._dp_blink_rate = [random.uniform(0.02, 0.1) for _ in range(count)]
+        self._dp_blink_state = [random.random() for _ in range(count)]
     
     def generate_markers(self, count):
-        """生成标记点"""
-        self.markers = []
-        for i in range(count):
-            angle = (i / count) * 2 * math.pi
-            self.markers.append({
-                'angle': angle,
-                'label': f"M{i+1}",
-                'distance': 0.82,
-                'active': random.choice([True, False])
-            })
+        """生成标记点
+        
+        标记点与数据点一样按属性分列保存，并预先安排下一次随机切换的时间
+        """
+        angles = [(i / count) * 2 * math.pi for i in range(count)]
+        
+        # 标记方向固定，预先计算方向的余弦与正弦
+        self._marker_cos = [math.cos(angle) for angle in angles]
+        self._marker_sin = [math.sin(angle) for angle in angles]
+        self._marker_labels = [f"M{i+1}" for i in range(count)]
+        self._marker_distance = 0.82
+        self._marker_active = [random.choice([True, False]) for _ in range(count)]
+        
+        self._schedule_marker_toggle()
     
-    def update_animation(self):
-        """更新动画效果"""
-        self.outer_ring_angle = (self.outer_ring_angle + 0.3) % 360
-        self.inner_ring_angle = (self.inner_ring_angle - 0.2) % 360
+    def _schedule_marker_toggle(self):
+        """按指数分布安排下一次标记切换（平均每秒0.4次）"""
+        self._next_marker_toggle = time.monotonic() + random.expovariate(0.4)
+    
+    def generate_spokes(self):
+        """随机生成外环辐条的长度和亮度"""
+        self._spoke_lengths = [random.uniform(5, 10) for _ in range(30)]
+        # 亮度取20级步进，使相同亮度的辐条可以合并为一次绘制
+        self._spoke_intensities = [random.randrange(100, 201, 20) for _ in range(30)]
+    
+    def _scan_line_rect(self):
+        """计算扫描线及其光点当前覆盖的区域"""
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        radius = min(center_x, center_y) * 0.9
+        
+        rad_angle = math.radians(self.scan_line_angle)
+        end_x = center_x + radius * 1.1 * math.sin(rad_angle)
+        end_y = center_y - radius * 1.1 * math.cos(rad_angle)
+        
+        # 外扩以包含线宽、抗锯齿边缘和末端光点
+        return QRectF(QPointF(center_x, center_y), QPointF(end_x, end_y)).normalized() \
+            .adjusted(-8, -8, 8, 8).toAlignedRect()
+    
+    def update_scan_line(self):
+        """旋转扫描线，只重绘其新旧位置所在的区域"""
         self.scan_line_angle = (self.scan_line_angle + 1.5) % 360
         
-        self.pulse_value += 0.05 * self.pulse_direction
-        if self.pulse_value >= 1.0:
-            self.pulse_value = 1.0
-            self.pulse_direction = -1
-        elif self.pulse_value <= 0.0:
-            self.pulse_value = 0.0
-            self.pulse_direction = 1
+        rect = self._scan_line_rect()
+        if self._scan_rect is not None:
+            self.update(rect.united(self._scan_rect))
+        else:
+            self.update(rect)
+        self._scan_rect = rect
+    
+    def update_animation(self):
+        """更新指针与装饰动画（每250毫秒一次，步长为原50毫秒步长的5倍）"""
+        self.outer_ring_angle = (self.outer_ring_angle + 1.5) % 360
+        self.inner_ring_angle = (self.inner_ring_angle - 1.0) % 360
+        
+        self.pulse_value = self._PULSE_LUT[self._frame % len(self._PULSE_LUT)]
+        self._frame += 1
+        
+        blink_states = [state + 5 * rate
+                        for state, rate in zip(self._dp_blink_state, self._dp_blink_rate)]
+        self._dp_blink_state = [state if state < 1.0 else 0.0 for state in blink_states]
         
-        for point in self.data_points:
-            point['blink_state'] += point['blink_rate']
-            if point['blink_state'] >= 1.0:
-                point['blink_state'] = 0.0
+        self.generate_spokes()
         
-        if random.random() < 0.02:
-            marker = random.choice(self.markers)
-            marker['active'] = not marker['active']
+        if time.monotonic() >= self._next_marker_toggle:
+            index = random.randrange(len(self._marker_active))
+            self._marker_active[index] = not self._marker_active[index]
+            self._schedule_marker_toggle()
         
+        self._overlay_dirty = True
         self.update()
     
+    def resizeEvent(self, event):
+        """尺寸变化时清除表盘几何缓存并重绘表盘位图"""
+        self._face_cache = None
+        self._text_cache = None
+        self._overlay_dirty = True
+        super().resizeEvent(event)
+        self._rebuild_face_pixmap()
+    
     def paintEvent(self, event):
         """绘制时钟"""
         super().paintEvent(event)
@@ -117,9 +242,46 @@ class AnalogClock(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        self.draw_clock_face(painter)
+        if self._face_pixmap is None or self._face_pixmap.deviceIndependentSize().toSize() != self.size():
+            self._rebuild_face_pixmap()
+        painter.drawPixmap(0, 0, self._face_pixmap)
+        
+        if self._overlay_dirty or self._overlay.deviceIndependentSize().toSize() != self.size():
+            self._rebuild_overlay()
+        painter.drawImage(0, 0, self._overlay)
+        
+        self.draw_scan_line(painter)
+    
+    def _rebuild_overlay(self):
+        """将指针与装饰绘制到复用的预乘透明图像"""
+        ratio = self.devicePixelRatioF()
+        size = self.size() * ratio
+        if self._overlay is None or self._overlay.size() != size:
+            self._overlay = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+            self._overlay.setDevicePixelRatio(ratio)
+        self._overlay.fill(0)
+        
+        painter = QPainter(self._overlay)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.draw_clock_hands(painter)
         self.draw_decorations(painter)
+        painter.end()
+        
+        self._overlay_dirty = False
+    
+    def _rebuild_face_pixmap(self):
+        """将静态表盘绘制到位图缓存"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.draw_clock_face(painter)
+        painter.end()
+        
+        self._face_pixmap = pixmap
     
     def draw_clock_face(self, painter):
         """绘制表盘"""
@@ -145,46 +307,78 @@ class AnalogClock(QWidget):
         painter.setPen(inner_pen)
         painter.drawEllipse(QPointF(center_x, center_y), inner_radius, inner_radius)
         
-        painter.setPen(QPen(QColor(0, 200, 0, 200), 1))
+        size = (self.width(), self.height())
+        if self._face_cache is None or self._face_cache['size'] != size:
+            self._face_cache = self._build_face_cache(painter, center_x, center_y, radius)
+        cache = self._face_cache
         
-        for i in range(60):
-            angle = i * 6
-            rad_angle = math.radians(angle)
+        # 每种画笔只调用一次批量绘制
+        painter.setPen(QPen(QColor(0, 255, 0, 220), 2))
+        painter.drawLines(cache['major_lines'])
+        painter.setPen(QPen(QColor(0, 180, 0, 150), 1))
+        painter.drawLines(cache['minor_lines'])
+        
+        painter.setFont(cache['font'])
+        painter.setPen(QColor(0, 255, 0))
+        for pos, text in cache['numerals']:
+            painter.drawText(pos, text)
+    
+    def _build_face_cache(self, painter, center_x, center_y, radius):
+        """预先计算表盘刻度线和数字位置
+        
+        Args:
+            painter: 用于获取字体度量的QPainter
+            center_x: 表盘中心x坐标
+            center_y: 表盘中心y坐标
+            radius: 表盘半径
             
+        Returns:
+            dict: 包含尺寸、刻度线、字体和数字位置的缓存
+        """
+        major_lines = []
+        minor_lines = []
+        
+        tick_cos = self._TICK_COS
+        tick_sin = self._TICK_SIN
+        
+        for i in range(60):
             start_radius = radius * (0.9 if i % 5 == 0 else 0.95)
             end_radius = radius * 1.0
             
-            start_x = center_x + start_radius * math.cos(rad_angle - math.pi/2)
-            start_y = center_y + start_radius * math.sin(rad_angle - math.pi/2)
-            end_x = center_x + end_radius * math.cos(rad_angle - math.pi/2)
-            end_y = center_y + end_radius * math.sin(rad_angle - math.pi/2)
+            start_x = center_x + start_radius * tick_cos[i]
+            start_y = center_y + start_radius * tick_sin[i]
+            end_x = center_x + end_radius * tick_cos[i]
+            end_y = center_y + end_radius * tick_sin[i]
             
+            line = QLine(int(start_x), int(start_y), int(end_x), int(end_y))
             if i % 5 == 0:
-                painter.setPen(QPen(QColor(0, 255, 0, 220), 2))
+                major_lines.append(line)
             else:
-                painter.setPen(QPen(QColor(0, 180, 0, 150), 1))
-                
-            painter.drawLine(int(start_x), int(start_y), int(end_x), int(end_y))
+                minor_lines.append(line)
         
         number_radius = radius * 0.75
         font = QFont("Courier New", int(radius/10), QFont.Weight.Bold)
         painter.setFont(font)
+        fm = painter.fontMetrics()
+        text_height = fm.height()
         
+        numerals = []
         for i in range(12):
-            angle = i * 30
-            rad_angle = math.radians(angle)
-            
-            x = center_x + number_radius * math.cos(rad_angle - math.pi/2)
-            y = center_y + number_radius * math.sin(rad_angle - math.pi/2)
+            # 第i个数字与第i*5个刻度方向相同
+            x = center_x + number_radius * tick_cos[i * 5]
+            y = center_y + number_radius * tick_sin[i * 5]
             
             text = str((i if i > 0 else 12))
-            
-            fm = painter.fontMetrics()
             text_width = fm.horizontalAdvance(text)
-            text_height = fm.height()
-            
-            painter.setPen(QColor(0, 255, 0))
-            painter.drawText(int(x - text_width/2), int(y + text_height/4), text)
+            numerals.append((QPoint(int(x - text_width/2), int(y + text_height/4)), text))
+        
+        return {
+            'size': (self.width(), self.height()),
+            'major_lines': major_lines,
+            'minor_lines': minor_lines,
+            'font': font,
+            'numerals': numerals,
+        }
     
     def draw_clock_hands(self, painter):
         """绘制时钟指针"""
@@ -201,44 +395,88 @@ class AnalogClock(QWidget):
         radius = min(center_x, center_y) * 0.9
         
         self.draw_hand(painter, center_x, center_y, radius, hour_angle, 
-                      self.hour_hand_length, 4, QColor(0, 200, 0, 220))
+                      self.hour_hand_length, 4, 'hour_hand')
         
         self.draw_hand(painter, center_x, center_y, radius, minute_angle, 
-                      self.minute_hand_length, 3, QColor(0, 255, 0, 220))
+                      self.minute_hand_length, 3, 'minute_hand')
         
         self.draw_hand(painter, center_x, center_y, radius, second_angle, 
-                      self.second_hand_length, 2, QColor(0, 255, 0, 180))
+                      self.second_hand_length, 2, 'second_hand')
         
-        painter.setPen(QPen(QColor(0, 255, 0), 1))
-        painter.setBrush(QBrush(QColor(0, 200, 0)))
+        painter.setPen(self._pens['hub'])
+        painter.setBrush(self._brushes['hub'])
         painter.drawEllipse(QPointF(center_x, center_y), 4, 4)
     
-    def draw_hand(self, painter, center_x, center_y, radius, angle, length, width, color):
-        """绘制指针"""
+    def draw_hand(self, painter, center_x, center_y, radius, angle, length, width, style):
+        """绘制指针，style为画笔缓存中的指针样式名"""
         rad_angle = math.radians(angle)
+        cos_a = math.cos(rad_angle)
+        sin_a = math.sin(rad_angle)
         
-        end_x = center_x + radius * length * math.cos(rad_angle - math.pi/2)
-        end_y = center_y + radius * length * math.sin(rad_angle - math.pi/2)
+        # 指针从12点方向顺时针旋转，针尖沿(sin, -cos)方向，底边两点沿垂直方向(cos, sin)展开
+        end_x = center_x + radius * length * sin_a
+        end_y = center_y - radius * length * cos_a
         
         pointer = QPolygonF()
+        pointer.append(QPointF(center_x + width * cos_a, center_y + width * sin_a))
+        pointer.append(QPointF(end_x, end_y))
+        pointer.append(QPointF(center_x - width * cos_a, center_y - width * sin_a))
         
-        side_angle1 = rad_angle - math.pi/2 + math.pi/2
-        side_angle2 = rad_angle - math.pi/2 - math.pi/2
-        side_length = width
+        painter.setPen(self._pens[style])
+        painter.setBrush(self._brushes[style])
+        painter.drawPolygon(pointer)
+    
+    def _build_text_cache(self, painter, radius):
+        """预先创建装饰文字的字体并测量固定文本
         
-        side_x1 = center_x + side_length * math.cos(side_angle1)
-        side_y1 = center_y + side_length * math.sin(side_angle1)
+        Args:
+            painter: 用于获取字体度量的QPainter
+            radius: 表盘半径
+            
+        Returns:
+            dict: 包含尺寸、字体和文本宽度的缓存
+        """
+        marker_font = QFont("Courier New", int(radius/15))
+        painter.setFont(marker_font)
+        fm = painter.fontMetrics()
+        label_widths = {label: fm.horizontalAdvance(label) for label in self._marker_labels}
+        marker_height = fm.height()
         
-        side_x2 = center_x + side_length * math.cos(side_angle2)
-        side_y2 = center_y + side_length * math.sin(side_angle2)
+        status_font = QFont("Courier New", int(radius/13), QFont.Weight.Bold)
+        painter.setFont(status_font)
+        status_width = painter.fontMetrics().horizontalAdvance("ALLIANCE SEC")
+        
+        return {
+            'size': (self.width(), self.height()),
+            'marker_font': marker_font,
+            'marker_height': marker_height,
+            'label_widths': label_widths,
+            'date_font': QFont("Courier New", int(radius/12)),
+            'date_text': None,
+            'date_width': 0,
+            'status_font': status_font,
+            'status_width': status_width,
+        }
+    
+    def draw_scan_line(self, painter):
+        """绘制旋转扫描线及其末端光点"""
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        radius = min(center_x, center_y) * 0.9
         
-        pointer.append(QPointF(side_x1, side_y1))
-        pointer.append(QPointF(end_x, end_y))
-        pointer.append(QPointF(side_x2, side_y2))
+        painter.save()
+        painter.translate(center_x, center_y)
+        painter.rotate(self.scan_line_angle)
         
-        painter.setPen(QPen(color, 1))
-        painter.setBrush(QBrush(color))
-        painter.drawPolygon(pointer)
+        painter.setPen(self._pens['scan_line'])
+        painter.drawLine(0, 0, 0, int(-radius * 1.1))
+        
+        glow_size = 3 + 2 * self.pulse_value
+        painter.setBrush(self._brushes['glow'])
+        painter.setPen(self._pens['glow'])
+        painter.drawEllipse(QPointF(0, -radius * 1.05), glow_size, glow_size)
+        
+        painter.restore()
     
     def draw_decorations(self, painter):
         """绘制装饰元素"""
@@ -250,22 +488,25 @@ class AnalogClock(QWidget):
         painter.translate(center_x, center_y)
         painter.rotate(self.outer_ring_angle)
         
-        painter.setPen(QPen(QColor(0, 150, 0, 80), 1, Qt.PenStyle.DotLine))
+        painter.setPen(self._pens['outer_ring'])
         painter.drawEllipse(QPointF(0, 0), radius * 1.05, radius * 1.05)
         
-        for i in range(30):
-            angle = i * (360 / 30)
-            rad_angle = math.radians(angle)
-            
-            length = random.uniform(5, 10)
-            start_x = (radius + 2) * math.cos(rad_angle)
-            start_y = (radius + 2) * math.sin(rad_angle)
-            end_x = (radius + 2 + length) * math.cos(rad_angle)
-            end_y = (radius + 2 + length) * math.sin(rad_angle)
+        ring_radius = radius + 2
+        spokes_by_intensity = {}
+        for (cos_a, sin_a), length, intensity in zip(self._SPOKE_DIRS, self._spoke_lengths,
+                                                      self._spoke_intensities):
+            start_x = ring_radius * cos_a
+            start_y = ring_radius * sin_a
+            end_x = (ring_radius + length) * cos_a
+            end_y = (ring_radius + length) * sin_a
             
-            intensity = random.randint(100, 200)
-            painter.setPen(QPen(QColor(0, intensity, 0, 130), 1))
-            painter.drawLine(int(start_x), int(start_y), int(end_x), int(end_y))
+            spokes_by_intensity.setdefault(intensity, []).append(
+                QLine(int(start_x), int(start_y), int(end_x), int(end_y)))
+        
+        # 每种亮度只设置一次画笔并批量绘制
+        for intensity, lines in spokes_by_intensity.items():
+            painter.setPen(self._spoke_pens[intensity])
+            painter.drawLines(lines)
         
         painter.restore()
         
@@ -274,109 +515,106 @@ class AnalogClock(QWidget):
         painter.rotate(-self.inner_ring_angle)
         
         inner_radius = radius * 0.4
-        painter.setPen(QPen(QColor(0, 120, 0, 100), 1, Qt.PenStyle.DashLine))
+        painter.setPen(self._pens['inner_ring'])
         painter.drawEllipse(QPointF(0, 0), inner_radius, inner_radius)
         
-        for i in range(6):
-            angle = i * (360 / 6)
-            rad_angle = math.radians(angle)
-            
-            start_x = inner_radius * 0.7 * math.cos(rad_angle)
-            start_y = inner_radius * 0.7 * math.sin(rad_angle)
-            end_x = inner_radius * 1.1 * math.cos(rad_angle)
-            end_y = inner_radius * 1.1 * math.sin(rad_angle)
+        radials = []
+        for cos_a, sin_a in self._RADIAL_DIRS:
+            start_x = inner_radius * 0.7 * cos_a
+            start_y = inner_radius * 0.7 * sin_a
+            end_x = inner_radius * 1.1 * cos_a
+            end_y = inner_radius * 1.1 * sin_a
             
-            painter.setPen(QPen(QColor(0, 150, 0, 120), 1))
-            painter.drawLine(int(start_x), int(start_y), int(end_x), int(end_y))
+            radials.append(QLine(int(start_x), int(start_y), int(end_x), int(end_y)))
         
-        painter.restore()
-        
-        painter.save()
-        painter.translate(center_x, center_y)
-        painter.rotate(self.scan_line_angle)
-        
-        scan_pen = QPen(QColor(0, 255, 0, 100), 2)
-        painter.setPen(scan_pen)
-        painter.drawLine(0, 0, 0, int(-radius * 1.1))
-        
-        glow_size = 3 + 2 * self.pulse_value
-        glow_color = QColor(50, 255, 100, 150)
-        painter.setBrush(QBrush(glow_color))
-        painter.setPen(QPen(glow_color, 1))
-        painter.drawEllipse(QPointF(0, -radius * 1.05), glow_size, glow_size)
+        painter.setPen(self._pens['radial'])
+        painter.drawLines(radials)
         
         painter.restore()
         
         pulse_radius = radius * (0.6 + 0.1 * self.pulse_value)
-        pulse_color = QColor(0, 200, 0, int(40 + 30 * self.pulse_value))
-        painter.setPen(QPen(pulse_color, 1))
+        painter.setPen(self._pulse_pens[int(40 + 30 * self.pulse_value)])
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawEllipse(QPointF(center_x, center_y), pulse_radius, pulse_radius)
         
-        for point in self.data_points:
-            angle = point['angle']
-            distance = point['distance']
-            
-            x = center_x + radius * distance * math.cos(angle)
-            y = center_y + radius * distance * math.sin(angle)
-            
-            blink_alpha = int(100 + 150 * math.sin(point['blink_state'] * math.pi))
-            point_color = QColor(0, point['intensity'], 0, blink_alpha)
-            
-            painter.setPen(QPen(point_color, 1))
-            painter.setBrush(QBrush(point_color))
-            painter.drawEllipse(QPointF(x, y), point['size'], point['size'])
-        
-        small_font = QFont("Courier New", int(radius/15))
-        painter.setFont(small_font)
-        
-        for marker in self.markers:
-            angle = marker['angle']
-            distance = marker['distance']
+        # 按样式分组，每组只设置一次画笔和画刷
+        dp_groups = {}
+        blink_alpha_lut = self._BLINK_ALPHA_LUT
+        for dx, dy, intensity, size, blink_state in zip(self._dp_dx, self._dp_dy,
+                                                        self._dp_intensity, self._dp_size,
+                                                        self._dp_blink_state):
+            # 查表得到量化后的透明度，使画笔和画刷可以复用
+            blink_alpha = blink_alpha_lut[int(blink_state * 1024)]
+            dp_groups.setdefault((intensity, blink_alpha), []).append(
+                (center_x + radius * dx, center_y + radius * dy, size))
+        
+        dp_styles = self._dp_styles
+        for key, points in dp_groups.items():
+            style = dp_styles.get(key)
+            if style is None:
+                point_color = QColor(0, key[0], 0, key[1])
+                style = dp_styles[key] = (QPen(point_color, 1), QBrush(point_color))
             
-            x = center_x + radius * distance * math.cos(angle)
-            y = center_y + radius * distance * math.sin(angle)
+            painter.setPen(style[0])
+            painter.setBrush(style[1])
+            for x, y, size in points:
+                painter.drawEllipse(QPointF(x, y), size, size)
+        
+        size = (self.width(), self.height())
+        if self._text_cache is None or self._text_cache['size'] != size:
+            self._text_cache = self._build_text_cache(painter, radius)
+        text_cache = self._text_cache
+        
+        painter.setFont(text_cache['marker_font'])
+        text_height = text_cache['marker_height']
+        label_widths = text_cache['label_widths']
+        
+        distance = self._marker_distance
+        for cos_a, sin_a, label, active in zip(self._marker_cos, self._marker_sin,
+                                               self._marker_labels, self._marker_active):
+            x = center_x + radius * distance * cos_a
+            y = center_y + radius * distance * sin_a
             
-            if marker['active']:
-                marker_color = QColor(0, 255, 0, 220)
+            if active:
+                marker_pen = self._pens['marker_active']
             else:
-                marker_color = QColor(0, 100, 0, 150)
+                marker_pen = self._pens['marker_inactive']
             
-            painter.setPen(QPen(marker_color, 1))
+            painter.setPen(marker_pen)
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawEllipse(QPointF(x, y), 6, 6)
             
-            text_x = x + 8 * math.cos(angle)
-            text_y = y + 8 * math.sin(angle)
+            text_x = x + 8 * cos_a
+            text_y = y + 8 * sin_a
             
-            fm = painter.fontMetrics()
-            text_width = fm.horizontalAdvance(marker['label'])
-            text_height = fm.height()
+            text_width = label_widths[label]
             
             text_x = max(min(text_x, self.width() - text_width), 0)
             text_y = max(min(text_y + text_height/2, self.height() - 2), text_height)
             
-            painter.setPen(marker_color)
-            painter.drawText(int(text_x), int(text_y), marker['label'])
+            painter.setPen(marker_pen)
+            painter.drawText(int(text_x), int(text_y), label)
         
         current_date = QDateTime.currentDateTime().toString("yyyy-MM-dd")
-        date_font = QFont("Courier New", int(radius/12))
-        painter.setFont(date_font)
+        painter.setFont(text_cache['date_font'])
         
         date_y = center_y + radius * 0.3
-        date_width = painter.fontMetrics().horizontalAdvance(current_date)
+        if text_cache['date_text'] != current_date:
+            # 日期变化时才重新测量宽度
+            text_cache['date_text'] = current_date
+            text_cache['date_width'] = painter.fontMetrics().horizontalAdvance(current_date)
+        date_width = text_cache['date_width']
         
-        painter.setPen(QColor(0, 200, 0))
+        painter.setPen(self._pens['date'])
         painter.drawText(int(center_x - date_width/2), int(date_y), current_date)
         
         status_text = "ALLIANCE SEC"
-        status_font = QFont("Courier New", int(radius/13), QFont.Weight.Bold)
-        painter.setFont(status_font)
+        painter.setFont(text_cache['status_font'])
         
         status_y = center_y - radius * 0.25
-        status_width = painter.fontMetrics().horizontalAdvance(status_text)
+        status_width = text_cache['status_width']
         
-        painter.setPen(QColor(0, 255, 0))
+        painter.setPen(self._pens['status'])
         painter.drawText(int(center_x - status_width/2), int(status_y), status_text)
 
 # 测试代码
@@ -11,13 +11,41 @@ from PyQt6.QtWidgets import (
     QPushButton, QWidget, QFormLayout, QComboBox,
     QMessageBox, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, QSettings, pyqtSlot
+from PyQt6.QtCore import (
+    Qt, QSettings, pyqtSlot, pyqtSignal, QObject, QRunnable, QThreadPool
+)
 from PyQt6.QtGui import QFont
 
 from core.translation_api import (
     TranslationAPI, OpenRouterTranslator
 )
 
+class _TestConnectionSignals(QObject):
+    """连接测试任务的信号"""
+    
+    finished = pyqtSignal(bool)  # 测试是否成功
+
+
+class _TestConnectionTask(QRunnable):
+    """在线程池中执行API连接测试，避免网络请求阻塞界面线程"""
+    
+    def __init__(self, api):
+        super().__init__()
+        self.api = api
+        # 信号对象在界面线程创建，完成信号会排队到界面线程处理
+        self.signals = _TestConnectionSignals()
+    
+    def run(self):
+        """执行连接测试并发出完成信号"""
+        try:
+            success = bool(self.api.test_connection())
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            success = False
+        self.signals.finished.emit(success)
+
+
 class APISettingsDialog(QDialog):
     """翻译API设置对话框"""
     
@@ -34,8 +62,10 @@ class APISettingsDialog(QDialog):
         # 加载保存的设置
         self.settings = QSettings("HDCTranslator", "Translation")
         
-        # 创建API实例
-        self.openrouter_api = OpenRouterTranslator()
+        # API实例在首次保存或测试连接时才创建，打开对话框时无需构建
+        self.openrouter_api = None
+        # 正在后台执行的连接测试任务
+        self._test_task = None
         
         # 主布局
         layout = QVBoxLayout(self)
@@ -81,7 +111,7 @@ class APISettingsDialog(QDialog):
         
         # 模型选择
         self.openrouter_model_combo = QComboBox()
-        self.openrouter_model_combo.addItems([
+        models = [
             "anthropic/claude-3-opus:beta",
             "anthropic/claude-3-5-sonnet-20240620",
             "anthropic/claude-3-opus-20240229",
@@ -99,7 +129,10 @@ class APISettingsDialog(QDialog):
             "google/gemma-7b-it",
             "google/gemini-pro",
             "google/gemini-1.5-pro-latest"
-        ])
+        ]
+        self.openrouter_model_combo.addItems(models)
+        # 模型名称到下拉框索引的映射，加载设置时直接查找
+        self._model_indices = {model: index for index, model in enumerate(models)}
         self.main_layout.addRow("模型:", self.openrouter_model_combo)
         
         # API基础URL
@@ -118,22 +151,55 @@ class APISettingsDialog(QDialog):
         instructions.setWordWrap(True)
         self.main_layout.addRow(instructions)
     
+    def _load_group(self, name, defaults):
+        """一次性读取设置分组中的多个键
+        
+        Args:
+            name: 设置分组名称
+            defaults: 键名到默认值的字典
+            
+        Returns:
+            dict: 键名到设置值的字典
+        """
+        self.settings.beginGroup(name)
+        try:
+            return {key: self.settings.value(key, default) for key, default in defaults.items()}
+        finally:
+            self.settings.endGroup()
+    
     def load_settings(self):
         """从设置加载值到控件"""
         # OpenRouter设置
-        self.openrouter_key_input.setText(self.settings.value("openrouter/api_key", ""))
-        model = self.settings.value("openrouter/model", "anthropic/claude-3-opus:beta")  # 更新默认模型
-        index = self.openrouter_model_combo.findText(model)
+        values = self._load_group("openrouter", {
+            "api_key": "",
+            "model": "anthropic/claude-3-opus:beta",  # 更新默认模型
+            "base_url": "https://openrouter.ai/api/v1/chat/completions",
+        })
+        
+        self.openrouter_key_input.setText(values["api_key"])
+        index = self._model_indices.get(values["model"], -1)
         if index >= 0:
             self.openrouter_model_combo.setCurrentIndex(index)
-        self.openrouter_url_input.setText(self.settings.value("openrouter/base_url", "https://openrouter.ai/api/v1/chat/completions"))
+        self.openrouter_url_input.setText(values["base_url"])
+    
+    def get_openrouter_api(self):
+        """获取OpenRouter API实例，首次调用时创建
+        
+        Returns:
+            OpenRouterTranslator: API实例
+        """
+        if self.openrouter_api is None:
+            self.openrouter_api = OpenRouterTranslator(self)
+        return self.openrouter_api
     
     def save_settings(self):
         """保存控件值到设置"""
         # OpenRouter设置
-        self.openrouter_api.set_api_key(self.openrouter_key_input.text())
-        self.openrouter_api.set_model(self.openrouter_model_combo.currentText())
-        self.openrouter_api.set_base_url(self.openrouter_url_input.text())
+        api = self.get_openrouter_api()
+        api.set_api_key(self.openrouter_key_input.text())
+        api.set_model(self.openrouter_model_combo.currentText())
+        api.set_base_url(self.openrouter_url_input.text())
+        api.save_settings()
     
     def accept(self):
         """保存设置并关闭对话框"""
@@ -142,19 +208,29 @@ class APISettingsDialog(QDialog):
     
     @pyqtSlot()
     def test_connection(self):
-        """测试API连接"""
+        """测试API连接，网络请求在线程池中执行"""
+        if self._test_task is not None:
+            return
+        
         # 先保存当前设置
         self.save_settings()
         
-        # 测试OpenRouter连接
-        api = self.openrouter_api
-        api_name = "OpenRouter"
+        # 测试期间禁用按钮并在按钮上显示进行中状态
+        self.test_button.setEnabled(False)
+        self.test_button.setText("测试中...")
         
-        QMessageBox.information(self, "测试中", f"正在测试{api_name}连接，请稍候...")
-        
-        # 测试连接
-        success = api.test_connection()
+        self._test_task = _TestConnectionTask(self.openrouter_api)
+        self._test_task.signals.finished.connect(self.on_test_finished)
+        QThreadPool.globalInstance().start(self._test_task)
+    
+    @pyqtSlot(bool)
+    def on_test_finished(self, success):
+        """连接测试完成后恢复按钮并显示结果"""
+        self._test_task = None
+        self.test_button.setEnabled(True)
+        self.test_button.setText("测试连接")
         
+        api_name = "OpenRouter"
         if success:
             QMessageBox.information(self, "连接成功", f"{api_name}连接测试成功!")
         else:
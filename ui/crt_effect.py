@@ -8,16 +8,22 @@ CRT效果组件
 
 import random
 import math
+import time
 from PyQt6.QtWidgets import QWidget, QApplication
-from PyQt6.QtCore import Qt, QTimer, QRect, QRectF, QPointF
+from PyQt6.QtCore import (
+    Qt, QTimer, QRect, QRectF, QPoint, QPointF, QSize, QAbstractEventDispatcher
+)
 from PyQt6.QtGui import (
     QPainter, QColor, QPen, QRadialGradient, QLinearGradient,
-    QPainterPath, QBrush, QImage, QPixmap
+    QPainterPath, QBrush, QImage, QPixmap, QPolygon
 )
 
 class CRTEffectWidget(QWidget):
     """CRT显示器效果覆盖层"""
 
+    # 两次重绘之间的最小间隔(秒)
+    MIN_REPAINT_INTERVAL = 1 / 60
+
     def __init__(self, parent=None):
         """初始化CRT效果组件"""
         super().__init__(parent)
@@ -41,9 +47,67 @@ class CRTEffectWidget(QWidget):
         self.scan_line_speed = 2
         self.noise_frame = 0
 
+        # 曲率、暗角、静态扫描线、色差和边框不随时间变化，预先绘制到位图并按尺寸失效
+        self._static_overlay = None
+        # 扫描线平铺图块及其对应的(不透明度, 设备像素比)
+        self._scanline_tile = None
+        self._scanline_tile_key = None
+        # 边框角落的渐变图块，与尺寸无关，首次使用时创建
+        self._corner_pix = None
+
+        # 每帧绘制的动态元素所用的画笔和渐变，创建一次后复用
+        # 亮扫描带的渐变定义在以扫描带顶端为原点的坐标系中，绘制时平移到当前位置
+        self._bright_gradient = QLinearGradient(0, 0, 0, 20)
+        self._bright_gradient.setColorAt(0, QColor(255, 255, 255, 0))
+        self._bright_gradient.setColorAt(0.5, QColor(255, 255, 255, 20))
+        self._bright_gradient.setColorAt(1, QColor(255, 255, 255, 0))
+        # 噪点和边角高光的透明度随闪烁只有少数几种取值，按透明度缓存画笔
+        self._noise_pens = {}
+        self._highlight_pens = {}
+        # 边角高光路径及其对应的尺寸
+        self._highlight_path = None
+        self._highlight_path_size = None
+
+        # 噪点使用持久的随机数生成器，每帧只生成一次，同一帧内的多次重绘复用
+        self._noise_rng = random.Random()
+        self._noise_polygon = None
+        self._noise_key = None
+
+        # 动画定时器只在组件可见、窗口未最小化且应用处于活动状态时运行
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.update_effects)
-        self.update_timer.start(50)
+        QApplication.instance().applicationStateChanged.connect(self._update_timer_state)
+
+        # 定时器只推进动画状态；重绘推迟到事件循环空闲(即将阻塞等待事件)时进行，并限制在60帧/秒以内
+        self._frame_pending = False
+        self._last_repaint = 0.0
+        QAbstractEventDispatcher.instance().aboutToBlock.connect(self._maybe_update)
+
+    def _should_animate(self):
+        """判断当前是否需要播放动画"""
+        if not self.isVisible():
+            return False
+        if self.window().windowState() & Qt.WindowState.WindowMinimized:
+            return False
+        return QApplication.applicationState() != Qt.ApplicationState.ApplicationInactive
+
+    def _update_timer_state(self, *args):
+        """根据可见性和应用状态启动或停止动画定时器"""
+        if self._should_animate():
+            if not self.update_timer.isActive():
+                self.update_timer.start(50)
+        elif self.update_timer.isActive():
+            self.update_timer.stop()
+
+    def showEvent(self, event):
+        """显示时恢复动画"""
+        super().showEvent(event)
+        self._update_timer_state()
+
+    def hideEvent(self, event):
+        """隐藏时停止动画"""
+        super().hideEvent(event)
+        self.update_timer.stop()
 
     def update_effects(self):
         """更新动态效果"""
@@ -55,24 +119,53 @@ class CRTEffectWidget(QWidget):
             self.current_flicker = random.uniform(-self.flicker_strength/3, self.flicker_strength/3)
 
         self.noise_frame += 1
+        self._frame_pending = True
+
+    def _maybe_update(self):
+        """事件循环空闲时，若动画状态已变化则请求重绘"""
+        if not self._frame_pending:
+            return
+        now = time.monotonic()
+        if now - self._last_repaint < self.MIN_REPAINT_INTERVAL:
+            return
+        self._frame_pending = False
+        self._last_repaint = now
         self.update()
 
     def resizeEvent(self, event):
         """窗口大小改变时的处理"""
+        if event.size() != event.oldSize():
+            self._static_overlay = None
         super().resizeEvent(event)
-        if self.parent():
-            self.setGeometry(0, 0, self.parent().width(), self.parent().height())
+        self._match_parent_geometry()
+
+    def _match_parent_geometry(self):
+        """使组件覆盖整个父组件，几何已一致时不做任何处理"""
+        parent = self.parent()
+        if parent is None:
+            return
+        target = QRect(0, 0, parent.width(), parent.height())
+        if self.geometry() != target:
+            self.setGeometry(target)
 
     def eventFilter(self, obj, event):
         """事件过滤器，用于响应父组件的变化"""
-        if obj == self.parent() and event.type() == event.Type.Resize:
-            self.setGeometry(0, 0, self.parent().width(), self.parent().height())
+        if obj == self.parent():
+            if event.type() == event.Type.Resize:
+                self._match_parent_geometry()
+            elif event.type() == event.Type.WindowStateChange:
+                # 窗口最小化时停止动画，恢复后重新启动
+                self._update_timer_state()
         return super().eventFilter(obj, event)
 
     def paintEvent(self, event):
         """绘制CRT效果"""
         super().paintEvent(event)
 
+        # 组件被完全遮挡或需要重绘的区域不在组件内时无需绘制
+        if self.visibleRegion().isEmpty() or not event.region().intersects(self.rect()):
+            return
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -80,12 +173,34 @@ class CRTEffectWidget(QWidget):
 
     def draw_crt_effects(self, painter):
         """绘制各种CRT效果"""
+        if self._static_overlay is None or self._static_overlay.deviceIndependentSize().toSize() != self.size():
+            self._rebuild_static_overlay()
+        painter.drawPixmap(0, 0, self._static_overlay)
+
+        # 只有亮扫描带、噪点和边角高光随时间变化
+        self.draw_bright_scan_line(painter)
+        self.draw_noise(painter)
+        self.draw_frame_highlight(painter)
+
+    def _rebuild_static_overlay(self):
+        """将不随时间变化的效果层绘制到位图缓存"""
+        # 在预乘透明格式的图像上绘制，这是QPainter合成最快的格式
+        ratio = self.devicePixelRatioF()
+        image = QImage(self.size() * ratio, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(0)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.draw_screen_curvature(painter)
         self.draw_vignette(painter)
         self.draw_scan_lines(painter)
-        self.draw_noise(painter)
         self.draw_chromatic_aberration(painter)
         self.draw_crt_frame(painter)
+        painter.end()
+
+        # 转换时保持预乘格式，避免每次贴图时逐像素转换
+        self._static_overlay = QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
 
     def draw_screen_curvature(self, painter):
         """绘制屏幕曲率效果"""
@@ -126,41 +241,80 @@ class CRTEffectWidget(QWidget):
         painter.fillRect(rect, gradient)
 
     def draw_scan_lines(self, painter):
-        """绘制扫描线效果"""
+        """绘制静态扫描线效果"""
         scan_line_spacing = 2
         scan_line_opacity = int(70 * self.scan_line_strength)
 
-        painter.setPen(QPen(QColor(0, 0, 0, scan_line_opacity), 1))
-
-        for y in range(0, self.height(), scan_line_spacing):
-            painter.drawLine(0, y, self.width(), y)
-
-        bright_scan_y = self.scan_line_y
-        bright_gradient = QLinearGradient(0, bright_scan_y - 10, 0, bright_scan_y + 10)
-        bright_gradient.setColorAt(0, QColor(255, 255, 255, 0))
-        bright_gradient.setColorAt(0.5, QColor(255, 255, 255, 20))
-        bright_gradient.setColorAt(1, QColor(255, 255, 255, 0))
-
-        scan_rect = QRectF(0, bright_scan_y - 10, self.width(), 20)
-        painter.fillRect(scan_rect, bright_gradient)
+        ratio = self.devicePixelRatioF()
+        if self._scanline_tile is None or self._scanline_tile_key != (scan_line_opacity, ratio):
+            self._scanline_tile = self._build_scanline_tile(scan_line_spacing, scan_line_opacity, ratio)
+            self._scanline_tile_key = (scan_line_opacity, ratio)
+
+        painter.drawTiledPixmap(0, 0, self.width(), self.height(), self._scanline_tile)
+
+    def _build_scanline_tile(self, spacing, opacity, ratio):
+        """创建一个扫描线周期高度的平铺图块
+
+        Args:
+            spacing: 扫描线间距(像素)
+            opacity: 扫描线不透明度
+            ratio: 设备像素比
+
+        Returns:
+            QPixmap: 平铺图块
+        """
+        tile_width = 64
+        tile = QPixmap(QSize(tile_width, spacing) * ratio)
+        tile.setDevicePixelRatio(ratio)
+        tile.fill(Qt.GlobalColor.transparent)
+
+        # 与逐行绘制时相同的抗锯齿线条，包括越过图块下边界、覆盖下一周期的那一条
+        tile_painter = QPainter(tile)
+        tile_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        tile_painter.setPen(QPen(QColor(0, 0, 0, opacity), 1))
+        tile_painter.drawLine(0, 0, tile_width, 0)
+        tile_painter.drawLine(0, spacing, tile_width, spacing)
+        tile_painter.end()
+
+        return tile
+
+    def draw_bright_scan_line(self, painter):
+        """绘制移动的亮扫描带"""
+        painter.save()
+        painter.translate(0, self.scan_line_y - 10)
+        painter.fillRect(QRectF(0, 0, self.width(), 20), self._bright_gradient)
+        painter.restore()
 
     def draw_noise(self, painter):
         """绘制随机噪点"""
         noise_opacity = int(30 + 10 * self.current_flicker)
         noise_count = int(self.width() * self.height() / 20000)
 
-        painter.setPen(QPen(QColor(255, 255, 255, noise_opacity), 1))
+        noise_pen = self._noise_pens.get(noise_opacity)
+        if noise_pen is None:
+            noise_pen = self._noise_pens[noise_opacity] = QPen(QColor(255, 255, 255, noise_opacity), 1)
+        painter.setPen(noise_pen)
 
-        random.seed(self.noise_frame)
+        width = self.width()
+        height = self.height()
 
-        for _ in range(noise_count):
-            x = random.randint(0, self.width())
-            y = random.randint(0, self.height())
-            size = random.randint(1, 2)
-            painter.drawPoint(x, y)
-            if size > 1:
-                painter.drawPoint(x+1, y)
-                painter.drawPoint(x, y+1)
+        noise_key = (self.noise_frame, width, height)
+        if self._noise_key != noise_key:
+            rng = self._noise_rng
+            points = []
+            for _ in range(noise_count):
+                x = rng.randint(0, width)
+                y = rng.randint(0, height)
+                size = rng.randint(1, 2)
+                points.append(QPoint(x, y))
+                if size > 1:
+                    points.append(QPoint(x+1, y))
+                    points.append(QPoint(x, y+1))
+            self._noise_polygon = QPolygon(points)
+            self._noise_key = noise_key
+
+        # 所有噪点使用同一画笔，一次批量绘制
+        painter.drawPoints(self._noise_polygon)
 
     def draw_chromatic_aberration(self, painter):
         """绘制色差效果"""
@@ -193,40 +347,63 @@ class CRTEffectWidget(QWidget):
 
         corner_size = 30
 
+        # 四个角使用同一块渐变图块，按角旋转后贴图（渐变沿对角线对称，旋转与镜像等价）
+        if self._corner_pix is None:
+            self._corner_pix = self._build_corner_pixmap(corner_size)
+
+        for x, y, angle in ((0, 0, 0), (width, 0, 90), (width, height, 180), (0, height, 270)):
+            painter.save()
+            painter.translate(x, y)
+            painter.rotate(angle)
+            painter.drawPixmap(0, 0, self._corner_pix)
+            painter.restore()
+
+    def _build_corner_pixmap(self, corner_size):
+        """创建边框角落的渐变图块
+
+        Args:
+            corner_size: 角落边长(像素)
+
+        Returns:
+            QPixmap: 从外角到内侧渐变的图块
+        """
+        image = QImage(corner_size, corner_size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(0)
+
         corner_gradient = QLinearGradient(0, 0, corner_size, corner_size)
         corner_gradient.setColorAt(0, QColor(50, 50, 50, 200))
         corner_gradient.setColorAt(1, QColor(20, 20, 20, 150))
+
+        painter = QPainter(image)
         painter.fillRect(0, 0, corner_size, corner_size, corner_gradient)
+        painter.end()
 
-        corner_gradient = QLinearGradient(width, 0, width - corner_size, corner_size)
-        corner_gradient.setColorAt(0, QColor(50, 50, 50, 200))
-        corner_gradient.setColorAt(1, QColor(20, 20, 20, 150))
-        painter.fillRect(width - corner_size, 0, corner_size, corner_size, corner_gradient)
+        return QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
 
-        corner_gradient = QLinearGradient(0, height, corner_size, height - corner_size)
-        corner_gradient.setColorAt(0, QColor(50, 50, 50, 200))
-        corner_gradient.setColorAt(1, QColor(20, 20, 20, 150))
-        painter.fillRect(0, height - corner_size, corner_size, corner_size, corner_gradient)
+    def draw_frame_highlight(self, painter):
+        """绘制随闪烁变化的边角高光"""
+        width = self.width()
+        height = self.height()
+        corner_size = 30
 
-        corner_gradient = QLinearGradient(width, height, width - corner_size, height - corner_size)
-        corner_gradient.setColorAt(0, QColor(50, 50, 50, 200))
-        corner_gradient.setColorAt(1, QColor(20, 20, 20, 150))
-        painter.fillRect(width - corner_size, height - corner_size, corner_size, corner_size, corner_gradient)
-
-        highlight_color = QColor(255, 255, 255, 10 + int(5 * self.current_flicker))
-        painter.setPen(highlight_color)
-
-        path = QPainterPath()
-        path.moveTo(0, corner_size)
-        path.lineTo(0, 0)
-        path.lineTo(corner_size, 0)
-        painter.drawPath(path)
-
-        path = QPainterPath()
-        path.moveTo(width - corner_size, height)
-        path.lineTo(width, height)
-        path.lineTo(width, height - corner_size)
-        painter.drawPath(path)
+        highlight_alpha = 10 + int(5 * self.current_flicker)
+        highlight_pen = self._highlight_pens.get(highlight_alpha)
+        if highlight_pen is None:
+            highlight_pen = self._highlight_pens[highlight_alpha] = QPen(QColor(255, 255, 255, highlight_alpha))
+        painter.setPen(highlight_pen)
+
+        # 左上角和右下角的高光折线合并为一条路径，尺寸不变时复用
+        if self._highlight_path is None or self._highlight_path_size != (width, height):
+            path = QPainterPath()
+            path.moveTo(0, corner_size)
+            path.lineTo(0, 0)
+            path.lineTo(corner_size, 0)
+            path.moveTo(width - corner_size, height)
+            path.lineTo(width, height)
+            path.lineTo(width, height - corner_size)
+            self._highlight_path = path
+            self._highlight_path_size = (width, height)
+        painter.drawPath(self._highlight_path)
 
 # 测试代码
 if __name__ == "__main__":
@@ -106,8 +106,9 @@ class MainWindow(QMainWindow):
         self.current_progress = 0
         self.progress_target = 0
         
-        # 翻译队列和正在翻译的标志
+        # 翻译队列、条目总数和正在翻译的标志
         self.translation_queue = []
+        self.translation_total = 0
         self.is_translating = False
     
     def centerWindow(self):
@@ -759,11 +760,13 @@ class MainWindow(QMainWindow):
             if item and item.text() == original_text:
                 # 设置译文
                 self.translation_table.setItem(row, 2, QTableWidgetItem(translated_text))
+                
+                # 只更新本条目的XML译文，确保翻译被保存
+                id_item = self.translation_table.item(row, 0)
+                if id_item:
+                    self.xml_handler.update_translation(id_item.text(), translated_text)
                 break
         
-        # 先更新XML条目，确保翻译被保存
-        self.update_xml_from_table()
-        
         # 更新统计信息
         self.update_translation_stats()
         
@@ -777,19 +780,18 @@ class MainWindow(QMainWindow):
             self.progress_chart.set_progress(translated_count, total_count)
             self.translation_stats_widget.update_translation_count(translated_count, total_count)
         
-        # 继续翻译队列中的下一项
+        # 从队列中移除已完成的条目
+        for i, (row, text) in enumerate(self.translation_queue):
+            if text == original_text:
+                del self.translation_queue[i]
+                break
+        
         if self.translation_queue:
-            row, text = self.translation_queue[0]
-            self.translation_queue = self.translation_queue[1:]
-            
-            # 更新状态
-            total = self.translation_table.rowCount()
-            progress = int((total - len(self.translation_queue) - 1) / total * 100)
-            self.progress_bar.setValue(progress)
-            self.status_label.set_text(f"正在翻译第 {total - len(self.translation_queue)} 条，共 {total} 条...")
-            
-            # 调用翻译器
-            self.translator.translate(text)
+            # 更新状态，其余条目由翻译器按批次继续翻译
+            total = self.translation_total
+            done = total - len(self.translation_queue)
+            self.progress_bar.setValue(int(done / total * 100))
+            self.status_label.set_text(f"已翻译 {done} 条，共 {total} 条...")
         else:
             # 翻译完成
             self.is_translating = False
@@ -878,26 +880,6 @@ class MainWindow(QMainWindow):
         
         # 如果没有XML文件，拒绝拖放
         event.ignore()
-        
-        # 如果还在翻译队列中，则继续下一个
-        if self.is_translating and self.translation_queue:
-            row, text = self.translation_queue[0]
-            self.translation_queue = self.translation_queue[1:]
-            
-            # 更新状态
-            total = self.translation_table.rowCount()
-            progress = int((total - len(self.translation_queue) - 1) / total * 100)
-            self.progress_bar.setValue(progress)
-            self.status_label.set_text(f"正在翻译第 {total - len(self.translation_queue)} 条，共 {total} 条...")
-            
-            # 调用翻译器
-            self.translator.translate(text)
-        else:
-            # 翻译完成或中止
-            self.is_translating = False
-            self.progress_bar.setValue(100)
-            self.add_log_entry("翻译过程中止")
-            self.status_label.set_text("翻译过程中止!")
     
     def on_xml_progress(self, value, message):
         """XML处理进度更新的回调"""
@@ -1356,14 +1338,14 @@ class MainWindow(QMainWindow):
         
         # 更新状态
         total = len(self.translation_queue)
+        self.translation_total = total
         self.add_log_entry(f"开始翻译 {total} 个条目")
-        self.status_label.set_text(f"正在翻译第 1 条，共 {total} 条...")
+        self.status_label.set_text(f"正在翻译，共 {total} 条...")
         self.progress_bar.setValue(0)
         
-        # 开始翻译第一个条目
-        row, text = self.translation_queue[0]
-        self.translation_queue = self.translation_queue[1:]
-        self.translator.translate(text)
+        # 将所有条目交给翻译器，由其在批处理窗口内合并为批量请求
+        for row, text in list(self.translation_queue):
+            self.translator.translate_async(text)
         
     def mark_selected_as_translated(self):
         """将选中的条目标记为已翻译（不实际翻译，只更改状态）"""
@@ -16,7 +16,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     Qt, QTimer, QSize, QRect, QPropertyAnimation, 
-    QEasingCurve, pyqtSignal
+    QEasingCurve, QElapsedTimer, pyqtSignal
 )
 from PyQt6.QtGui import (
     QFont, QColor, QPalette, QPixmap, QPainter, QBrush, QPen, 
@@ -28,6 +28,13 @@ class StartupSplashScreen(QSplashScreen):
     
     # 添加一个信号，用于通知右键跳过
     skip_requested = pyqtSignal()
+    # 启动动画结束（消息播放完毕或被跳过）
+    intro_finished = pyqtSignal()
+    # 某条启动消息打字完成，参数为消息序号
+    message_completed = pyqtSignal(int)
+    
+    # 打字机效果每个字符的间隔(毫秒)
+    CHAR_INTERVAL_MS = 15
     
     def __init__(self):
         """初始化启动画面"""
@@ -42,10 +49,14 @@ class StartupSplashScreen(QSplashScreen):
         
         self.current_message = ""
         self.display_message = ""
-        self.typing_index = 0
-        self.typing_speed = 1
         self.typing_active = False
-        self.typing_complete_callback = None
+        
+        # 预先计算的消息播放时间表，每帧为(时间毫秒, 消息序号, 已显示字符数)
+        self.schedule_messages = []
+        self.schedule_frames = None
+        self.schedule_index = 0
+        self.schedule_end = 0
+        self.schedule_clock = QElapsedTimer()
         
         self.displayed_messages = []
         self.message_y_start = 270
@@ -71,10 +82,6 @@ UDS翻译终端
         
         self.noise_count = 0
         
-        self.typing_timer = QTimer(self)
-        self.typing_timer.timeout.connect(self.update_typing)
-        self.typing_timer.setInterval(15)
-        
         self.terminal_line = 0
         self.max_terminal_lines = 40
         self.terminal_timer = QTimer(self)
@@ -90,6 +97,7 @@ UDS翻译终端
         
         self.scan_line_pos = (self.scan_line_pos + self.scan_speed) % self.height()
         self.noise_count += 1
+        self.advance_schedule()
         self.update()
     
     def update_terminal_display(self):
@@ -98,40 +106,59 @@ UDS翻译终端
             self.terminal_line += 1
             self.update()
     
-    def update_typing(self):
-        """更新打字机效果"""
-        if not self.typing_active:
-            return
-            
-        if self.typing_index < len(self.current_message):
-            next_index = min(self.typing_index + self.typing_speed, len(self.current_message))
-            self.display_message = self.current_message[:next_index]
-            self.typing_index = next_index
-            self.update()
-        else:
-            self.typing_active = False
-            self.typing_timer.stop()
-            self.displayed_messages.append(self.current_message)
-            
-            if self.typing_complete_callback:
-                callback = self.typing_complete_callback
-                self.typing_complete_callback = None
-                callback()
+    def play_messages(self, messages):
+        """
+        按预先计算的时间表以打字机效果依次播放启动消息
+        
+        时间表由动画定时器推进，每条消息打字完成时发出message_completed，
+        全部播放完毕(含最后一条消息后的停顿)时发出intro_finished
+        
+        Args:
+            messages: [(消息文本, 该消息显示完成后的停顿毫秒数), ...]
+        """
+        frames = []
+        t = 0
+        for index, (message, pause) in enumerate(messages):
+            for count in range(1, len(message) + 1):
+                t += self.CHAR_INTERVAL_MS
+                frames.append((t, index, count))
+            t += pause
+        
+        self.schedule_messages = [message for message, _ in messages]
+        self.schedule_frames = frames
+        self.schedule_index = 0
+        self.schedule_end = t
+        self.schedule_clock.start()
     
-    def showMessage(self, message, alignment=Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft, color=Qt.GlobalColor.green):
-        """显示消息（重写QSplashScreen的方法）"""
-        self.current_message = message
-        self.typing_index = 0
-        self.display_message = ""
-        self.typing_active = True
+    def advance_schedule(self):
+        """根据已播放时间推进消息时间表"""
+        if self.schedule_frames is None:
+            return
         
-        if not self.typing_timer.isActive():
-            self.typing_timer.start()
-    
-    def showMessageWithCallback(self, message, callback, alignment=Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft, color=Qt.GlobalColor.green):
-        """显示消息并在完成后执行回调"""
-        self.typing_complete_callback = callback
-        self.showMessage(message, alignment, color)
+        elapsed = self.schedule_clock.elapsed()
+        frames = self.schedule_frames
+        frame = None
+        
+        while self.schedule_index < len(frames) and frames[self.schedule_index][0] <= elapsed:
+            frame = frames[self.schedule_index]
+            self.schedule_index += 1
+            
+            _, index, count = frame
+            message = self.schedule_messages[index]
+            if count == len(message):
+                self.displayed_messages.append(message)
+                self.message_completed.emit(index)
+        
+        if frame is not None:
+            _, index, count = frame
+            message = self.schedule_messages[index]
+            self.current_message = message
+            self.display_message = message[:count]
+            self.typing_active = count < len(message)
+        
+        if self.schedule_index >= len(frames) and elapsed >= self.schedule_end:
+            self.schedule_frames = None
+            self.intro_finished.emit()
     
     def mousePressEvent(self, event):
         """鼠标点击事件处理"""
@@ -444,24 +471,16 @@ if __name__ == "__main__":
     splash.show()
     
     messages = [
-        "初始化系统...",
-        "加载翻译协议...",
-        "建立安全连接...",
-        "验证联盟授权...",
-        "准备终端界面...",
-        "访问已授权 - 权限已验证",
-        "正在启动主界面..."
+        ("初始化系统...", 200),
+        ("加载翻译协议...", 200),
+        ("建立安全连接...", 200),
+        ("验证联盟授权...", 200),
+        ("准备终端界面...", 200),
+        ("访问已授权 - 权限已验证", 200),
+        ("正在启动主界面...", 500)
     ]
     
-    def show_next_message(index=0):
-        if index < len(messages):
-            splash.showMessageWithCallback(
-                messages[index],
-                lambda: QTimer.singleShot(200, lambda: show_next_message(index + 1))
-            )
-        else:
-            QTimer.singleShot(500, app.quit)
-    
-    QTimer.singleShot(1000, lambda: show_next_message(0))
+    splash.intro_finished.connect(app.quit)
+    QTimer.singleShot(1000, lambda: splash.play_messages(messages))
     
     sys.exit(app.exec())